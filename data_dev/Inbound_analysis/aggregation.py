@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple
+
+
+def group_codes(keys: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    키 컬럼을 한 번만 factorize 하여 행별 그룹 번호와 정렬된 키 목록을 반환합니다.
+    (키가 없는 행의 그룹 번호는 -1, groupby 와 같이 키 오름차순)
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    return codes, pd.Index(uniques, name=keys.name)
+
+
+def first_valid_positions(
+    codes: np.ndarray, valid: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """
+    그룹별로 값이 있는 첫 행의 위치를 반환합니다. (값이 있는 행이 없으면 -1)
+    """
+    positions = np.flatnonzero(valid & (codes >= 0))
+    group_ids, first = np.unique(codes[positions], return_index=True)
+    result = np.full(n_groups, -1, dtype=np.int64)
+    result[group_ids] = positions[first]
+    return result
+
+
+def take_first(series: pd.Series, positions: np.ndarray) -> pd.Series:
+    """
+    positions 위치의 값을 dtype 을 유지한 채 가져옵니다. (-1 위치는 결측값)
+    groupby "first" 와 같이 object 컬럼의 결측값은 None 입니다.
+    """
+    values = series.array
+    if not (positions < 0).any():
+        return pd.Series(values.take(positions), name=series.name)
+    if pd.api.types.is_object_dtype(series):
+        taken = pd.api.extensions.take(
+            series.to_numpy(), positions, allow_fill=True, fill_value=None
+        )
+    else:
+        taken = pd.api.extensions.take(values, positions, allow_fill=True)
+    return pd.Series(taken, name=series.name)
+
+
+def aggregate_first_and_sum(
+    df: pd.DataFrame,
+    key: str,
+    sum_columns: List[str],
+    count_column: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    key 별로 한 번에 집계합니다.
+    - count_column: 그룹 행 수 (None 이면 만들지 않음)
+    - sum_columns: 합계
+    - 나머지 컬럼: 그룹에서 값이 있는 첫 행의 값
+    결과는 groupby(key, as_index=False).agg 와 같은 순서/타입입니다.
+    (key, 나머지 컬럼, count_column, sum_columns 순서, 키가 없는 행은 제외)
+    """
+    codes, uniques = group_codes(df[key])
+    n_groups = len(uniques)
+    grouped = codes >= 0
+
+    result = {key: pd.Series(uniques.to_numpy(), name=key)}
+    for col in df.columns:
+        if col == key or col in sum_columns or col == count_column:
+            continue
+        valid = df[col].notna().to_numpy()
+        result[col] = take_first(df[col], first_valid_positions(codes, valid, n_groups))
+
+    if count_column is not None:
+        counts = np.bincount(codes[grouped], minlength=n_groups).astype(np.int64)
+        if not grouped.all():
+            # 키가 없는 행이 있으면 transform("count") 결과가 float 이었으므로 타입을 맞춤
+            counts = counts.astype(np.float64)
+        result[count_column] = pd.Series(counts, name=count_column)
+
+    order = np.argsort(codes[grouped], kind="stable")
+    starts = np.searchsorted(codes[grouped][order], np.arange(n_groups))
+    for col in sum_columns:
+        values = df[col].fillna(0).to_numpy()[grouped][order]
+        if values.dtype.kind in "iub":
+            values = values.astype(np.int64)
+        sums = np.add.reduceat(values, starts) if n_groups else values[:0]
+        result[col] = pd.Series(sums, name=col)
+
+    return pd.DataFrame(result)
+
+
+def merge_partials(
+    partials: List[pd.DataFrame], key: str, sum_columns: List[str]
+) -> pd.DataFrame:
+    """
+    청크별 부분 집계 결과를 합칩니다.
+    행 수/합계 컬럼(sum_columns)은 더하고, 나머지 컬럼은 먼저 나온 청크의 값을 유지하므로
+    청크 순서대로 넘기면 전체를 한 번에 집계한 결과와 같습니다.
+    """
+    if len(partials) == 1:
+        return partials[0]
+    combined = pd.concat(partials, ignore_index=True)
+    return aggregate_first_and_sum(combined, key, sum_columns)
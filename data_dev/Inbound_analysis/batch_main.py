@@ -0,0 +1,180 @@
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Tuple
+import pandas as pd
+from config import (
+    DOWNLOAD_FOLDER,
+    COMPLETE_FOLDER,
+    DB_CONFIG,
+    COLUMN_MAPPING,
+    ORDER_TYPE_MAPPING,
+    INCREMENTAL_LOAD,
+    PROCESSING_MODE,
+    PROCESSING_WORKERS,
+    PROCESSING_ENGINE,
+    COUNTRY_MODE,
+    UPLOAD_WORKERS,
+    BATCH_FILE_PATTERN,
+    BATCH_WORKERS,
+)
+from database import create_tables, upload_to_mysql
+from data_processor import main_data_processing, main_data_processing_chunked
+from excel_cache import read_excel_cached, get_content_hash
+from excel_reader import read_source_sheet, iter_source_chunks, SOURCE_VARIANT
+from file_handler import find_pending_files, move_to_complete_folder
+
+# 다운로드 폴더에 쌓인 주간 리포트를 한 번에 처리하는 일괄 처리 스크립트
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    filename="app.log",
+    filemode="a",
+)
+logger = logging.getLogger(__name__)
+
+
+def setup_config() -> Dict[str, Any]:
+    """
+    설정 정보를 반환합니다. (main.py 와 같은 처리 설정)
+    """
+    return {
+        "DOWNLOAD_FOLDER": DOWNLOAD_FOLDER,
+        "COMPLETE_FOLDER": COMPLETE_FOLDER,
+        "DB_CONFIG": DB_CONFIG,
+        "COLUMN_MAPPING": COLUMN_MAPPING,
+        "ORDER_TYPE_MAPPING": ORDER_TYPE_MAPPING,
+        "INCREMENTAL_LOAD": INCREMENTAL_LOAD,
+        "PROCESSING_MODE": PROCESSING_MODE,
+        "PROCESSING_WORKERS": PROCESSING_WORKERS,
+        "PROCESSING_ENGINE": PROCESSING_ENGINE,
+        "COUNTRY_MODE": COUNTRY_MODE,
+        "UPLOAD_WORKERS": UPLOAD_WORKERS,
+    }
+
+
+def check_batch_config(config: Dict[str, Any]) -> None:
+    """
+    일괄 처리에서 main.py 와 다르게 동작하는 설정을 알립니다.
+    """
+    notices = []
+    if config.get("PROCESSING_MODE") == "parallel":
+        notices.append(
+            "PROCESSING_MODE='parallel': 파일별 작업 프로세스에서 full 모드로 처리합니다."
+        )
+    if config.get("COUNTRY_MODE") == "all":
+        notices.append("COUNTRY_MODE='all': 일괄 처리는 KR 테이블에만 업로드합니다.")
+    if config.get("INCREMENTAL_LOAD"):
+        notices.append(
+            "INCREMENTAL_LOAD: 일괄 처리는 주간 파일 전체를 더하는 방식으로 업로드합니다."
+        )
+    for notice in notices:
+        print(f"설정 안내: {notice}")
+        logger.warning(notice)
+
+
+def process_single_file(
+    file_path: str, config: Dict[str, Any]
+) -> Tuple[str, pd.DataFrame, Dict[str, Any]]:
+    """
+    작업 프로세스에서 파일 하나를 읽고 전처리합니다.
+    (PROCESSING_ENGINE 과 PROCESSING_MODE="chunked" 는 main.py 와 같이 적용)
+    """
+    if config.get("PROCESSING_MODE") == "chunked":
+        chunks = iter_source_chunks(file_path, "CS Receiving TAT")
+        processed_df, stats = main_data_processing_chunked(chunks, config)
+        return file_path, processed_df, stats
+
+    df = read_excel_cached(
+        file_path, "CS Receiving TAT", loader=read_source_sheet, variant=SOURCE_VARIANT
+    )
+    processed_df, stats = main_data_processing(df, config)
+    return file_path, processed_df, stats
+
+
+def process_files_in_parallel(
+    file_paths: List[str], config: Dict[str, Any], max_workers: int = BATCH_WORKERS
+) -> Tuple[List[str], Dict[str, pd.DataFrame]]:
+    """
+    여러 파일을 프로세스 풀에서 병렬로 처리합니다.
+    실패한 파일은 건너뛰며, 성공한 파일 목록(파일 이름 순서)과 파일별 처리 결과를 반환합니다.
+    """
+    results: Dict[str, pd.DataFrame] = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(process_single_file, path, config): path
+            for path in file_paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                _, processed_df, stats = future.result()
+            except Exception as e:
+                print(f"  [실패] {os.path.basename(path)}: {str(e)}")
+                logger.error(f"파일 처리 중 오류 발생 ({path}): {str(e)}", exc_info=True)
+                continue
+
+            results[path] = processed_df
+            print(
+                f"  [완료] {os.path.basename(path)}: {stats['processed_unique_count']} 건 "
+                f"(일치율 {stats['match_rate']:.2f}%)"
+            )
+
+    # 업로드 순서가 실행할 때마다 같도록 파일 이름 순서로 정렬
+    processed_files = [path for path in file_paths if path in results]
+    return processed_files, results
+
+
+def main():
+    """
+    메인 함수: 처리 대기 파일 검색, 병렬 전처리, 한 번에 업로드, 완료 폴더로 이동
+    """
+    config = setup_config()
+
+    try:
+        print("\n엑셀 파일 일괄 변환 프로그램")
+        print("=" * 40)
+        check_batch_config(config)
+        file_paths = find_pending_files(
+            DOWNLOAD_FOLDER, COMPLETE_FOLDER, BATCH_FILE_PATTERN
+        )
+        if not file_paths:
+            print("처리할 파일이 없습니다.")
+            return
+
+        print(f"처리할 파일 {len(file_paths)}개")
+        processed_files, results = process_files_in_parallel(file_paths, config)
+        if not processed_files:
+            print("\n처리에 성공한 파일이 없습니다.")
+            return
+
+        print("\n테이블 생성 중...")
+        create_tables()
+
+        # 파일별로 업로드하여 적재 원장에 원본 파일 해시를 남김
+        # (중간에 실패해도 다시 실행하면 반영되지 않은 행만 업로드)
+        print("\n데이터베이스에 업로드 중...")
+        for path in processed_files:
+            summary = upload_to_mysql(
+                results[path],
+                source_hash=get_content_hash(path),
+                source_name=os.path.basename(path),
+            )
+            print(
+                f"  {os.path.basename(path)}: 새 행 {summary['inserted']}, "
+                f"변경 {summary['updated']}, 건너뜀 {summary['skipped']}"
+            )
+            move_to_complete_folder(path, COMPLETE_FOLDER)
+        print("데이터베이스 업로드 완료")
+
+        print(f"\n처리 완료! ({len(processed_files)}/{len(file_paths)} 파일)")
+
+    except Exception as e:
+        print(f"\n예상치 못한 오류 발생: {str(e)}")
+        logger.error(f"예상치 못한 오류 발생: {str(e)}", exc_info=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 # 데이터베이스 설정 정보
 DB_CONFIG: Dict[str, Any] = {
@@ -18,12 +18,74 @@ DB_CONFIG: Dict[str, Any] = {
 DOWNLOAD_FOLDER: str = "C:\\MyMain\\Teckwah\\download\\xlsx_files"
 COMPLETE_FOLDER: str = "C:\\MyMain\\Teckwah\\download\\xlsx_files_complete"
 
+# 일괄 처리 대상 파일 패턴 및 병렬 작업 프로세스 수 (None 이면 CPU 코어 수)
+BATCH_FILE_PATTERN: str = "*_ReceivingTAT_report.xlsx"
+BATCH_WORKERS: Optional[int] = None
+
+# 파싱된 엑셀 시트 캐시 설정 (파일 내용 해시 기준, 최대 크기 초과 시 LRU 삭제)
+EXCEL_CACHE_ENABLED: bool = True
+CACHE_FOLDER: str = "C:\\MyMain\\Teckwah\\download\\cache"
+CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+# 증분 적재 설정: 누적 리포트에서 이전 적재 이후 행이 추가/변경된 Cust Sys No 만 처리하여
+# 기존 값을 교체 (Quantity/Count_PO 도 더하지 않음)
+INCREMENTAL_LOAD: bool = False
+INCREMENTAL_STATE_FILE: str = "C:\\MyMain\\Teckwah\\download\\incremental_state.json"
+# 기준 시점보다 이 일수 이상 오래된 키가 추가/변경되면 소급 입력으로 경고 로그 (건너뛰지 않음)
+INCREMENTAL_LOOKBACK_DAYS: int = 14
+
 # 데이터베이스 연결 풀 설정
 POOL_NAME: str = "mypool"
 POOL_SIZE: int = 5
+# 풀의 연결이 모두 사용 중일 때 빈 연결을 기다리는 최대 시간 (초)
+POOL_WAIT_TIMEOUT: float = 30.0
+# 끊어진 연결 재연결 시도 횟수
+POOL_RECONNECT_ATTEMPTS: int = 3
+
+# 엑셀 스트리밍 읽기 설정 (청크당 최대 행 수)
+EXCEL_CHUNK_SIZE: int = 5000
+
+# 청크 처리 시 한 번에 처리 단계를 실행할 최소 행 수
+# (작은 청크는 이 크기까지 모아서 처리하여 청크마다 드는 고정 비용을 줄임)
+PROCESS_MIN_CHUNK_ROWS: int = 5000
+
+# 데이터 처리 방식
+# "full": 전체를 한 번에, "chunked": EXCEL_CHUNK_SIZE 행씩 읽어 부분 집계를 합침,
+# "parallel": Cust Sys No 해시로 나눈 파티션을 여러 프로세스에서 처리
+PROCESSING_MODE: str = "full"
+
+# parallel 모드 프로세스 수 (None 이면 CPU 코어 수)
+PROCESSING_WORKERS: Optional[int] = None
+
+# 데이터 처리 엔진 ("pandas" 또는 "polars")
+# "polars": 변환/집계를 하나의 lazy plan 으로 멀티스레드 실행 (결과와 통계는 pandas 엔진과 동일)
+PROCESSING_ENGINE: str = "pandas"
+
+# 처리할 국가 범위
+# "KR": KR 행만 처리하여 Receiving_TAT_Report 에 업로드,
+# "all": 모든 국가를 한 번에 처리하여 국가별 테이블(KR 은 Receiving_TAT_Report,
+# 그 외 국가는 Receiving_TAT_Report_<국가코드>)에 동시에 업로드
+COUNTRY_MODE: str = "KR"
+
+# 국가별 동시 업로드 스레드 수 (POOL_SIZE 이하)
+UPLOAD_WORKERS: int = 4
+
+# Receiving_TAT_Report 업로드 방식
+# "load_data": 임시 파일을 LOAD DATA LOCAL INFILE 로 스테이징 테이블에 적재한 뒤
+# INSERT ... SELECT 한 번으로 병합 (서버에서 local_infile 이 꺼져 있으면 batch 로 대체),
+# "batch": UPLOAD_CHUNK_SIZE 행씩 여러 행 INSERT ... ON DUPLICATE KEY UPDATE 후 청크마다 커밋
+UPLOAD_METHOD: str = "load_data"
+
+# batch 업로드 청크당 행 수
+UPLOAD_CHUNK_SIZE: int = 1000
+
+# DB 조회 시 한 번에 가져오는 행 수 (스트리밍 청크 크기, 전체 스캔의 페이지 크기)
+READ_CHUNK_SIZE: int = 10000
 
 # 타임아웃 설정
 DOWNLOAD_TIMEOUT: int = 120
+# 다운로드된 파일 크기가 변하지 않는지 확인하는 간격 (초)
+DOWNLOAD_STABLE_INTERVAL: float = 0.5
 WEBDRIVER_TIMEOUT: int = 30
 
 # 주문 타입 매핑 정보
@@ -57,9 +119,50 @@ COLUMN_MAPPING = {
     "Count_PO": "Count_PO",
 }
 
+# 'Cust Sys No' 컬럼의 다른 이름 (리포트 버전에 따라 다름)
+CUST_SYS_NO_ALIASES: List[str] = [
+    "Customer System Number",
+    "Customer Sys No",
+    "Cust System No",
+]
+
+# COLUMN_MAPPING 외에 엑셀에서 추가로 읽을 원본 컬럼
+EXTRA_SOURCE_COLUMNS: List[str] = ["ActualPhysicalReceiptDate"]
+
+# 엑셀 읽기 시 원본 컬럼별 dtype 힌트 ("str", "numeric", "datetime")
+SOURCE_DTYPES: Dict[str, str] = {
+    "ReceiptNo": "str",
+    "Replen/Balance Order#": "str",
+    "Cust Sys No": "str",
+    "Allocated Part#": "str",
+    "EDI Order Type": "str",
+    "ShipFromCode": "str",
+    "ShipToCode": "str",
+    "Country": "str",
+    "Quantity": "numeric",
+    "PutAwayDate": "datetime",
+    "ActualPhysicalReceiptDate": "datetime",
+}
+
 # 테이블 이름
 ORDER_TYPE_TABLE: str = "OrderType"
 RECEIVING_TAT_REPORT_TABLE: str = "Receiving_TAT_Report"
+DIM_DATE_TABLE: str = "DimDate"
+LOAD_LEDGER_TABLE: str = "Load_Ledger"
+LOAD_LEDGER_ROWS_TABLE: str = "Load_Ledger_Rows"
+SCHEMA_VERSION_TABLE: str = "Schema_Version"
+
+# 적재 원장 사용 여부: 원본 파일 해시별로 반영된 Cust_Sys_No 를 기록하여
+# 같은 파일을 다시 업로드해도 Quantity/Count_PO 가 중복으로 더해지지 않게 함
+LOAD_LEDGER_ENABLED: bool = True
+
+# 행 내용 해시(Row_Hash) 비교 사용 여부: 값을 교체하는 업로드(증분 적재)에서 테이블에 저장된
+# 해시를 조회하여 새 행과 내용이 바뀐 행만 업로드 (같은 내용의 행은 건너뜀)
+ROW_HASH_DIFF_ENABLED: bool = True
+
+# DimDate 테이블에 채울 연도 범위 (마이그레이션에서 한 번 채우므로 바꾸면 새 마이그레이션 단계 필요)
+DIM_DATE_START_YEAR: int = 2020
+DIM_DATE_END_YEAR: int = 2030
 
 # 재시도 설정
 MAX_RETRIES: int = 3
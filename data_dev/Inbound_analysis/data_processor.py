@@ -1,16 +1,163 @@
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict, Any
+from typing import (
+    Tuple,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
 import logging
-from datetime import date
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from config import PROCESS_MIN_CHUNK_ROWS
+from fiscal_calendar import FiscalCalendar
+from aggregation import aggregate_first_and_sum, merge_partials
+from transforms import TransformMemo
+from schema import (
+    CATEGORICAL_COLUMNS,
+    DOWNCAST_INTEGER_COLUMNS,
+    downcast_integer,
+    enforce_schema,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class Stage:
+    """
+    DataProcessor 의 처리 단계 하나를 나타냅니다.
+    requires 는 단계가 읽는 컬럼, produces 는 단계가 만들거나 바꾸는(삭제 포함) 컬럼입니다.
+    is_filter 단계는 행만 걸러내므로 optimize_stages 가 앞쪽으로 옮길 수 있고,
+    row_wise 가 False 인 단계(집계 등)는 필터가 넘어갈 수 없습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[pd.DataFrame], pd.DataFrame],
+        requires: Sequence[str] = (),
+        produces: Sequence[str] = (),
+        is_filter: bool = False,
+        row_wise: bool = True,
+    ):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.produces = tuple(produces)
+        self.is_filter = is_filter
+        self.row_wise = row_wise
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name})"
+
+
+def optimize_stages(stages: List[Stage]) -> List[Stage]:
+    """
+    필터 단계를 필요한 컬럼이 준비된 가장 앞 위치로 옮깁니다. (filter pushdown)
+    필터는 행 단위 단계만 넘어갈 수 있고, 필터가 읽는 컬럼을 만드는 단계 뒤에 둡니다.
+    """
+    optimized: List[Stage] = []
+    for stage in stages:
+        position = len(optimized)
+        if stage.is_filter:
+            while position > 0:
+                previous = optimized[position - 1]
+                if (
+                    previous.is_filter
+                    or not previous.row_wise
+                    or set(previous.produces) & set(stage.requires)
+                ):
+                    break
+                position -= 1
+        optimized.insert(position, stage)
+    return optimized
+
+
 class DataProcessor:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self.fiscal_calendar = FiscalCalendar()
+        # 고유값 단위 변환 결과 (같은 DataProcessor 의 모든 단계/청크에서 재사용)
+        self.transforms = TransformMemo()
+        self.stages = optimize_stages(self._build_stages())
+        logger.info(f"Processing stages: {[stage.name for stage in self.stages]}")
+
+    def _build_stages(self) -> List[Stage]:
+        """
+        처리 단계를 논리적인 순서로 선언합니다. (실행 순서는 optimize_stages 가 정함)
+        """
+        # dtype 계획은 값을 바꾸지 않으므로 produces 를 비워 둠 (필터가 넘어갈 수 있음)
+        return [
+            Stage(
+                "rename_columns",
+                self._rename_columns,
+                requires=list(self.config["COLUMN_MAPPING"].keys()),
+                produces=list(self.config["COLUMN_MAPPING"].values()),
+            ),
+            Stage("apply_dtype_plan", self._apply_dtype_plan),
+            Stage(
+                "convert_data_types",
+                self._convert_data_types,
+                requires=["Quantity", "PutAwayDate", "ActualPhysicalReceiptDate"],
+                produces=[
+                    "Quantity",
+                    "PutAwayDate",
+                    "InventoryDate",
+                    "ActualPhysicalReceiptDate",
+                ],
+            ),
+            Stage(
+                "clean_replen_balance_order",
+                self._clean_replen_balance_order,
+                requires=["Replen_Balance_Order"],
+                produces=["Replen_Balance_Order"],
+            ),
+            Stage(
+                "handle_ship_from_code",
+                self._handle_ship_from_code,
+                requires=["ShipFromCode"],
+                produces=["ShipFromCode"],
+            ),
+            Stage(
+                "calculate_fiscal_data",
+                self._calculate_fiscal_data,
+                requires=["PutAwayDate"],
+                produces=["Week", "FY", "Quarter", "Month"],
+            ),
+            Stage(
+                "map_order_type",
+                self._map_order_type,
+                requires=["EDI_Order_Type"],
+                produces=["OrderType"],
+            ),
+            Stage("apply_dtype_plan", self._apply_dtype_plan),
+            Stage(
+                "filter_country",
+                self._filter_country,
+                requires=["Country"],
+                is_filter=True,
+            ),
+            Stage(
+                "aggregate_duplicates",
+                self._aggregate_duplicates,
+                requires=["Cust_Sys_No", "Quantity"],
+                produces=["Count_PO", "Quantity"],
+                row_wise=False,
+            ),
+            Stage(
+                "handle_missing_values",
+                self._handle_missing_values,
+                row_wise=False,
+            ),
+            Stage("enforce_schema", enforce_schema),
+        ]
 
     def process_dataframe(
         self, df: pd.DataFrame
@@ -18,39 +165,189 @@ class DataProcessor:
         logger.info(f"Original columns: {df.columns.tolist()}")
         original_unique_count = df["Cust Sys No"].nunique()
 
-        df = self._rename_columns(df)
-        df = self._convert_data_types(df)
-        df = self._clean_replen_balance_order(df)
-        df = self._handle_ship_from_code(df)
-        df = self._calculate_fiscal_data(df)
-        df = self._map_order_type(df)
-
-        if "Country" in df.columns:
-            df = df[df["Country"] == "KR"]
-            logger.info("Filtered data for Country 'KR'")
-
-        df = self._aggregate_duplicates(df)
-        df = self._handle_missing_values(df)
+        df, stage_metrics = self._run_stages(df, self.stages)
 
         stats = self._calculate_stats(df, original_unique_count)
+        stats["stage_metrics"] = stage_metrics
         logger.info(f"Final columns: {df.columns.tolist()}")
         return df, stats
 
+    def process_chunks(
+        self, chunks: Iterable[pd.DataFrame], min_rows: int = PROCESS_MIN_CHUNK_ROWS
+    ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        원본 데이터를 청크 단위로 처리합니다.
+        청크마다 집계 전 단계를 실행하고 Cust_Sys_No 별 부분 집계(행 수, Quantity 합계,
+        첫 값)만 남겨 합치므로, 메모리는 원본 행 수가 아니라 유니크 키 수에 비례합니다.
+        min_rows 보다 작은 청크는 그 크기까지 모아서 한 번에 처리합니다.
+        결과는 process_dataframe 과 같습니다. (category 카테고리는 enforce_schema 가 맞춤)
+        """
+        split = [stage.name for stage in self.stages].index("aggregate_duplicates")
+        row_stages, final_stages = self.stages[:split], self.stages[split + 1 :]
+
+        # 단계별 지표는 모든 청크의 값을 더해서 보고
+        stage_metrics = [
+            {"stage": stage.name, "seconds": 0.0, "rows_in": 0, "rows_out": 0}
+            for stage in self.stages
+        ]
+        source_keys = set()
+        # partials[0] 은 지금까지 합친 결과, 나머지는 아직 합치지 않은 청크별 부분 집계
+        # (쌓인 크기가 합친 결과 이상일 때만 합쳐서 청크 수에 비례한 재집계를 피함)
+        partials: List[pd.DataFrame] = []
+        chunk_count = 0
+        for chunk, count in _coalesce_chunks(chunks, min_rows):
+            chunk_count += count
+            source_keys.update(chunk["Cust Sys No"].dropna().unique())
+
+            chunk, chunk_metrics = self._run_stages(chunk, row_stages)
+
+            rows_in = len(chunk)
+            start = time.perf_counter()
+            partials.append(self._aggregate_duplicates(chunk))
+            if sum(len(p) for p in partials[1:]) >= len(partials[0]):
+                partials = [self._merge_partials(partials)]
+            chunk_metrics.append(
+                {
+                    "stage": self.stages[split].name,
+                    "seconds": time.perf_counter() - start,
+                    "rows_in": rows_in,
+                    "rows_out": 0,
+                }
+            )
+            _add_metrics(stage_metrics, chunk_metrics)
+
+        if not partials:
+            logger.info("처리할 데이터가 없습니다.")
+            stats = self._calculate_stats(pd.DataFrame(), 0)
+            stats["stage_metrics"] = []
+            stats["chunk_count"] = 0
+            return pd.DataFrame(), stats
+
+        start = time.perf_counter()
+        partial = self._merge_partials(partials)
+        stage_metrics[split]["seconds"] += time.perf_counter() - start
+        stage_metrics[split]["rows_out"] = len(partial)
+
+        df, final_metrics = self._run_stages(partial, final_stages)
+        _add_metrics(stage_metrics[split + 1 :], final_metrics)
+
+        stats = self._calculate_stats(df, len(source_keys))
+        stats["stage_metrics"] = stage_metrics
+        stats["chunk_count"] = chunk_count
+        logger.info(f"Final columns: {df.columns.tolist()} ({chunk_count} chunks)")
+        return df, stats
+
+    def process_by_country(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict[str, Any]]]:
+        """
+        KR 필터 없이 모든 국가를 한 번에 처리하여 국가별 결과와 통계를 반환합니다.
+        집계 전 단계는 전체 데이터에 한 번만 실행하고, Country 로 나눈 뒤
+        국가별로 집계/결측값 처리/스키마 적용을 합니다.
+        (국가별 결과 값은 해당 국가 행만 처리한 결과와 같고,
+        category 컬럼의 카테고리는 해당 국가 결과에 있는 값으로 줄임)
+        """
+        if "Cust Sys No" not in df.columns or "Country" not in df.columns:
+            raise ValueError("국가별 처리에는 Cust Sys No, Country 컬럼이 필요합니다.")
+        logger.info(f"Original columns: {df.columns.tolist()}")
+        original_unique_counts = df.groupby("Country")["Cust Sys No"].nunique()
+
+        split = [stage.name for stage in self.stages].index("aggregate_duplicates")
+        row_stages = [stage for stage in self.stages[:split] if not stage.is_filter]
+        final_stages = self.stages[split:]
+
+        df, shared_metrics = self._run_stages(df, row_stages)
+
+        missing_country = int(df["Country"].isna().sum())
+        if missing_country:
+            logger.info(f"Country 가 없는 {missing_country}개 행은 제외합니다.")
+
+        partitions: Dict[str, pd.DataFrame] = {}
+        country_stats: Dict[str, Dict[str, Any]] = {}
+        for country, partition in df.groupby("Country", observed=True, sort=True):
+            # 다른 국가의 카테고리가 남지 않도록 해당 국가 값으로 줄임
+            for col in partition.columns:
+                if isinstance(partition[col].dtype, pd.CategoricalDtype):
+                    partition[col] = partition[col].cat.remove_unused_categories()
+
+            partition, stage_metrics = self._run_stages(partition, final_stages)
+            stats = self._calculate_stats(
+                partition, int(original_unique_counts[country])
+            )
+            stats["stage_metrics"] = stage_metrics
+            partitions[country] = partition
+            country_stats[country] = stats
+
+        logger.info("국가 공통 단계:")
+        for metric in shared_metrics:
+            logger.info(
+                f"  {metric['stage']}: {metric['seconds']:.3f}s "
+                f"({metric['rows_in']} -> {metric['rows_out']} rows)"
+            )
+        logger.info(f"처리된 국가: {list(partitions)}")
+        return partitions, country_stats
+
+    def _merge_partials(self, partials: List[pd.DataFrame]) -> pd.DataFrame:
+        return merge_partials(partials, "Cust_Sys_No", ["Count_PO", "Quantity"])
+
+    def _run_stages(
+        self, df: pd.DataFrame, stages: List[Stage]
+    ) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        단계를 순서대로 실행하며 단계별 소요 시간과 입출력 행 수를 기록합니다.
+        """
+        stage_metrics = []
+        for stage in stages:
+            rows_in = len(df)
+            start = time.perf_counter()
+            df = stage.func(df)
+            elapsed = time.perf_counter() - start
+            stage_metrics.append(
+                {
+                    "stage": stage.name,
+                    "seconds": elapsed,
+                    "rows_in": rows_in,
+                    "rows_out": len(df),
+                }
+            )
+            logger.info(
+                f"Stage {stage.name}: {elapsed:.3f}s, rows {rows_in} -> {len(df)}"
+            )
+        return df, stage_metrics
+
     def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Renaming columns")
         return df.rename(columns=self.config["COLUMN_MAPPING"])
 
+    def _apply_dtype_plan(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        저카디널리티 컬럼은 category 로, 정수 컬럼은 가장 작은 안전한 정수 타입으로 맞춥니다.
+        (이미 맞춰진 컬럼은 건너뛰므로 여러 단계에서 다시 호출해도 됩니다.)
+        """
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("category")
+
+        for col in DOWNCAST_INTEGER_COLUMNS:
+            if col in df.columns:
+                df[col] = downcast_integer(df[col])
+        return df
+
     def _convert_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Converting data types")
         if "Quantity" in df.columns:
-            df["Quantity"] = (
+            df["Quantity"] = downcast_integer(
                 pd.to_numeric(df["Quantity"], errors="coerce").fillna(0).astype("Int64")  # 문자열을 숫자형으로 변환하고 변환 불가능한 값은 NaN으로 처리
             )
 
         date_columns = ["PutAwayDate", "ActualPhysicalReceiptDate"]
         for col in date_columns:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors="coerce")
+            if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                df[col] = self.transforms.apply(
+                    "to_datetime",
+                    df[col],
+                    lambda values: pd.to_datetime(values, errors="coerce"),
+                )
 
         # PutAwayDate가 없는 경우 ActualPhysicalReceiptDate로 대체
         if "PutAwayDate" in df.columns and "ActualPhysicalReceiptDate" in df.columns:
@@ -59,7 +356,7 @@ class DataProcessor:
             ]
 
         if "PutAwayDate" in df.columns:
-            df["InventoryDate"] = df["PutAwayDate"].dt.date
+            df["InventoryDate"] = df["PutAwayDate"].dt.normalize()
 
         # ActualPhysicalReceiptDate 컬럼 제거
         if "ActualPhysicalReceiptDate" in df.columns:
@@ -71,71 +368,78 @@ class DataProcessor:
     def _clean_replen_balance_order(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Cleaning Replen_Balance_Order")
         if "Replen_Balance_Order" in df.columns:
-            df["Replen_Balance_Order"] = (
-                df["Replen_Balance_Order"].astype(str).str.split(".").str[0]
+            # 소수점 이하를 버리고 스키마 타입(Int64)으로 변환 (숫자가 아니면 결측값)
+            df["Replen_Balance_Order"] = self.transforms.apply(
+                "replen_balance_order",
+                df["Replen_Balance_Order"],
+                lambda values: pd.to_numeric(
+                    values.astype(str).str.split(".").str[0], errors="coerce"
+                ).astype("Int64"),
             )
-            numeric_mask = df["Replen_Balance_Order"].str.isnumeric()
-            df.loc[numeric_mask, "Replen_Balance_Order"] = pd.to_numeric(
-                df.loc[numeric_mask, "Replen_Balance_Order"], errors="coerce"
-            ).astype("Int64")
         return df
 
     # ShipFromCode의 값이 REMARK라면 none으로 처리
     def _handle_ship_from_code(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Handling ShipFromCode")
         if "ShipFromCode" in df.columns:
-            df.loc[df["ShipFromCode"].str.upper() == "REMARK", "ShipFromCode"] = np.nan
+            is_remark = self.transforms.apply(
+                "is_remark",
+                df["ShipFromCode"],
+                lambda values: values.str.upper() == "REMARK",
+            )
+            df.loc[is_remark, "ShipFromCode"] = np.nan
         return df
 
     def _calculate_fiscal_data(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Calculating fiscal data")
         if "PutAwayDate" in df.columns:
-            fiscal_data = df["PutAwayDate"].apply(
-                lambda x: (
-                    self.get_dell_week_and_fy(x)
-                    if pd.notna(x)
-                    else ("Unknown", "Unknown")
-                )
+            # 회계 속성은 날짜(일)에만 의존하므로 InventoryDate 의 고유값으로 계산
+            dates = (
+                df["InventoryDate"]
+                if "InventoryDate" in df.columns
+                else df["PutAwayDate"].dt.normalize()
             )
-            df["Week"] = fiscal_data.apply(lambda x: x[0])
-            df["FY"] = fiscal_data.apply(lambda x: x[1])
-            df["Quarter"] = df["PutAwayDate"].apply(
-                lambda x: self.get_quarter(x) if pd.notna(x) else "Unknown"
+            fiscal_data = self.transforms.apply(
+                "fiscal_data",
+                dates,
+                self.fiscal_calendar.compute,
+                categorical=True,
             )
-            df["Month"] = df["PutAwayDate"].dt.strftime("%m").fillna("00")
+            for col in ["Week", "FY", "Quarter", "Month"]:
+                df[col] = fiscal_data[col]
         return df
 
     def _map_order_type(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Mapping order types")
-        df["OrderType"] = (
-            df["EDI_Order_Type"]
-            .map(self.config["ORDER_TYPE_MAPPING"])
-            .fillna("Unknown")
-        )
+        order_type = df["EDI_Order_Type"].map(self.config["ORDER_TYPE_MAPPING"])
+        # category 컬럼은 매핑이 1:1 이면 결과도 category 이므로 object 로 바꾼 뒤 채움
+        df["OrderType"] = order_type.astype(object).fillna("Unknown")
+        return df
+
+    def _filter_country(self, df: pd.DataFrame) -> pd.DataFrame:
+        if "Country" in df.columns:
+            df = df[df["Country"] == "KR"].copy()
+            logger.info("Filtered data for Country 'KR'")
         return df
 
     def _aggregate_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Aggregating duplicates")
 
-        # Count_PO를 미리 계산
-        df["Count_PO"] = df.groupby("Cust_Sys_No")["Cust_Sys_No"].transform("count")
-
-        # 모든 컬럼에 대해 첫 번째 값을 선택하되, Quantity는 합계를 계산
-        agg_funcs = {
-            col: "first" for col in df.columns if col not in ["Cust_Sys_No", "Quantity"]
-        }
-        agg_funcs["Quantity"] = "sum"
-
-        # 그룹화 및 집계
-        df = df.groupby("Cust_Sys_No", as_index=False).agg(agg_funcs)
-
-        return df
-
+        # Cust_Sys_No 를 한 번만 factorize 하여 Count_PO(행 수), Quantity(합계),
+        # 나머지 컬럼(값이 있는 첫 행)을 함께 계산
+        return aggregate_first_and_sum(
+            df, "Cust_Sys_No", sum_columns=["Quantity"], count_column="Count_PO"
+        )
 
     def _handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         logger.info("Handling missing values")
         for col in df.columns:
-            if pd.api.types.is_object_dtype(df[col]):
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                if df[col].isna().any():
+                    if "" not in df[col].cat.categories:
+                        df[col] = df[col].cat.add_categories("")
+                    df[col] = df[col].fillna("")
+            elif pd.api.types.is_object_dtype(df[col]):
                 df[col] = df[col].fillna("")
             elif pd.api.types.is_numeric_dtype(df[col]):
                 df[col] = df[col].fillna(0)
@@ -156,38 +460,181 @@ class DataProcessor:
             "match_rate": match_rate,
         }
 
-    def get_fy_start(self, date: pd.Timestamp) -> pd.Timestamp:
-        year = (
-            date.year
-            if date.month >= 2 or (date.month == 2 and date.day >= 7)
-            else date.year - 1
+
+def _coalesce_chunks(
+    chunks: Iterable[pd.DataFrame], min_rows: int
+) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    비어 있지 않은 청크를 min_rows 행 이상이 될 때까지 모아
+    (합친 청크, 합친 원본 청크 수) 로 반환합니다.
+    """
+    pending: List[pd.DataFrame] = []
+    rows = 0
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        pending.append(chunk)
+        rows += len(chunk)
+        if rows >= min_rows:
+            yield _concat_pending(pending), len(pending)
+            pending, rows = [], 0
+    if pending:
+        yield _concat_pending(pending), len(pending)
+
+
+def _concat_pending(pending: List[pd.DataFrame]) -> pd.DataFrame:
+    if len(pending) == 1:
+        return pending[0]
+    return pd.concat(pending, ignore_index=True)
+
+
+def _add_metrics(
+    totals: List[Dict[str, Any]], metrics: List[Dict[str, Any]]
+) -> None:
+    """
+    단계별 지표를 같은 위치의 누적 지표에 더합니다.
+    """
+    for total, metric in zip(totals, metrics):
+        total["seconds"] += metric["seconds"]
+        total["rows_in"] += metric["rows_in"]
+        total["rows_out"] += metric["rows_out"]
+
+
+def _log_stats(stats: Dict[str, Any]) -> None:
+    logger.info("Data Processing Statistics:")
+    logger.info(f"Original unique records: {stats['original_unique_count']}")
+    logger.info(f"Processed unique records: {stats['processed_unique_count']}")
+    logger.info(f"Match rate: {stats['match_rate']:.2f}%")
+    for metric in stats["stage_metrics"]:
+        logger.info(
+            f"  {metric['stage']}: {metric['seconds']:.3f}s "
+            f"({metric['rows_in']} -> {metric['rows_out']} rows)"
         )
-        feb_1 = pd.Timestamp(year=year, month=2, day=1)
-        return feb_1 + pd.Timedelta(days=(5 - feb_1.dayofweek) % 7)
 
-    def get_dell_week_and_fy(self, date: pd.Timestamp) -> Tuple[str, str]:
-        fy_start = self.get_fy_start(date)
-        fy = fy_start.year + 1 if date >= fy_start else fy_start.year
-        days_since_fy_start = (date - fy_start).days
-        dell_week = (days_since_fy_start // 7) + 1
-        return f"WK{dell_week:02d}", f"FY{fy % 100:02d}"
 
-    def get_quarter(self, date: pd.Timestamp) -> str:
-        fy_start = self.get_fy_start(date)
-        days_since_fy_start = (date - fy_start).days
-        quarter = (days_since_fy_start // 91) + 1
-        return f"Q{min(quarter, 4)}"
+def _log_country_stats(country_stats: Dict[str, Dict[str, Any]]) -> None:
+    logger.info("Data Processing Statistics by Country:")
+    logger.info(f"{'Country':<8}{'Original':>10}{'Processed':>11}{'Match rate':>12}")
+    for country, stats in country_stats.items():
+        logger.info(
+            f"{country:<8}{stats['original_unique_count']:>10}"
+            f"{stats['processed_unique_count']:>11}{stats['match_rate']:>11.2f}%"
+        )
 
 
 def main_data_processing(
     df: pd.DataFrame, config: Dict[str, Any]
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    if config.get("PROCESSING_ENGINE") == "polars":
+        from polars_engine import main_data_processing_polars
+
+        return main_data_processing_polars(df, config)
+
     processor = DataProcessor(config)
     processed_df, stats = processor.process_dataframe(df)
+    _log_stats(stats)
+    return processed_df, stats
+
+
+def partition_by_key(
+    df: pd.DataFrame, key: str, partition_count: int
+) -> List[pd.DataFrame]:
+    """
+    key 값의 해시로 행을 partition_count 개로 나눕니다.
+    같은 key 의 행은 항상 같은 파티션에 원래 순서대로 들어갑니다.
+    """
+    hashes = pd.util.hash_pandas_object(df[key], index=False).to_numpy()
+    partition_ids = hashes % np.uint64(partition_count)
+    return [df[partition_ids == i] for i in range(partition_count)]
+
+
+def _process_partition(
+    partition: pd.DataFrame, config: Dict[str, Any]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    return DataProcessor(config).process_dataframe(partition)
+
+
+def _combine_partitions(results: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    파티션별 결과를 합쳐 직렬 처리와 같은 순서/타입으로 만듭니다.
+    category 컬럼은 모든 파티션의 카테고리를 합친 같은 dtype 으로 맞춥니다.
+    (직렬 처리의 enforce_schema 와 같이 결측값 대체용 "" 를 포함해 정렬된 순서)
+    """
+    results = list(results)
+    for col in results[0].columns:
+        if not isinstance(results[0][col].dtype, pd.CategoricalDtype):
+            continue
+        categories = set()
+        for result in results:
+            categories.update(result[col].cat.categories)
+        dtype = pd.CategoricalDtype(sorted(categories))
+        for result in results:
+            result[col] = result[col].astype(dtype)
+
+    df = pd.concat(results, ignore_index=True)
+    return df.sort_values("Cust_Sys_No", kind="stable", ignore_index=True)
+
+
+def main_data_processing_parallel(
+    df: pd.DataFrame, config: Dict[str, Any], max_workers: Optional[int] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Cust Sys No 해시로 나눈 파티션을 프로세스 풀에서 각각 전체 단계로 처리하고 합칩니다.
+    (모든 단계가 행 단위이거나 Cust_Sys_No 별 집계이므로 결과는 main_data_processing 과 같음)
+    """
+    workers = max_workers or config.get("PROCESSING_WORKERS") or os.cpu_count() or 1
+    if workers <= 1 or len(df) < workers:
+        return main_data_processing(df, config)
+
+    partitions = [
+        partition
+        for partition in partition_by_key(df, "Cust Sys No", workers)
+        if not partition.empty
+    ]
+    logger.info(f"{len(partitions)}개 파티션을 {workers}개 프로세스로 처리합니다.")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outputs = list(
+            executor.map(_process_partition, partitions, [config] * len(partitions))
+        )
+
+    processed_df = _combine_partitions(result for result, _ in outputs)
+
+    processor = DataProcessor(config)
+    stats = processor._calculate_stats(processed_df, df["Cust Sys No"].nunique())
+    # 단계별 지표는 파티션 값을 더한 값 (소요 시간은 프로세스 시간 합계)
+    stage_metrics = [
+        {"stage": stage.name, "seconds": 0.0, "rows_in": 0, "rows_out": 0}
+        for stage in processor.stages
+    ]
+    for _, partition_stats in outputs:
+        _add_metrics(stage_metrics, partition_stats["stage_metrics"])
+    stats["stage_metrics"] = stage_metrics
+    stats["partition_count"] = len(partitions)
+
+    _log_stats(stats)
+    return processed_df, stats
 
-    logger.info("Data Processing Statistics:")
-    logger.info(f"Original unique records: {stats['original_unique_count']}")
-    logger.info(f"Processed unique records: {stats['processed_unique_count']}")
-    logger.info(f"Match rate: {stats['match_rate']:.2f}%")
 
+def main_data_processing_by_country(
+    df: pd.DataFrame, config: Dict[str, Any]
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Dict[str, Any]]]:
+    """
+    모든 국가를 한 번에 처리하여 국가별 결과와 통계를 반환합니다.
+    """
+    processor = DataProcessor(config)
+    partitions, country_stats = processor.process_by_country(df)
+    _log_country_stats(country_stats)
+    return partitions, country_stats
+
+
+def main_data_processing_chunked(
+    chunks: Iterable[pd.DataFrame], config: Dict[str, Any]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    원본 데이터를 청크 단위로 처리합니다. (결과는 main_data_processing 과 같음)
+    """
+    processor = DataProcessor(config)
+    processed_df, stats = processor.process_chunks(chunks)
+    _log_stats(stats)
     return processed_df, stats
@@ -1,61 +1,197 @@
 import mysql.connector
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from mysql.connector import pooling
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 import logging
 from config import (
     DB_CONFIG,
     POOL_NAME,
     POOL_SIZE,
+    POOL_WAIT_TIMEOUT,
+    POOL_RECONNECT_ATTEMPTS,
     ORDER_TYPE_TABLE,
     RECEIVING_TAT_REPORT_TABLE,
     ORDER_TYPE_MAPPING,
+    DIM_DATE_TABLE,
+    LOAD_LEDGER_TABLE,
+    LOAD_LEDGER_ROWS_TABLE,
+    UPLOAD_WORKERS,
+    UPLOAD_METHOD,
+    UPLOAD_CHUNK_SIZE,
+    READ_CHUNK_SIZE,
+    LOAD_LEDGER_ENABLED,
+    ROW_HASH_DIFF_ENABLED,
+)
+from migrations import run_migrations
+from schema import (
+    RECEIVING_TAT_COLUMNS,
+    ROW_HASH_COLUMN,
+    row_hashes,
+    to_db_rows,
+    write_load_data_file,
 )
 
 logger = logging.getLogger(__name__)
 
+# 업로드 시 기존 값에 더하는 컬럼 (나머지 컬럼은 새 값으로 교체)
+ACCUMULATED_COLUMNS: List[str] = ["Quantity", "Count_PO"]
+
+# LOAD DATA LOCAL INFILE 을 쓸 수 없을 때의 오류 코드
+# (1148: 명령 비허용, 2068: 클라이언트 거부, 3948: 서버 local_infile 꺼짐)
+LOAD_DATA_DISABLED_ERRORS = (1148, 2068, 3948)
+
+
+class SharedConnectionPool:
+    """
+    프로세스 전체에서 하나만 만들어 재사용하는 연결 풀입니다.
+    연결을 꺼낼 때 ping 으로 상태를 확인하여 끊어진 연결은 다시 연결하고,
+    풀이 모두 사용 중이면 POOL_WAIT_TIMEOUT 까지 기다립니다.
+    """
+
+    WAIT_INTERVAL: float = 0.05
+
+    def __init__(self, pool_size: int = POOL_SIZE):
+        self.pool = mysql.connector.pooling.MySQLConnectionPool(
+            pool_name=POOL_NAME, pool_size=pool_size, **DB_CONFIG
+        )
+        self._lock = threading.Lock()
+        self.stats = {
+            "created": pool_size,
+            "checkouts": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "reconnects": 0,
+        }
+
+    def _count(self, key: str, value=1):
+        with self._lock:
+            self.stats[key] += value
+
+    def get_connection(self, timeout: float = POOL_WAIT_TIMEOUT):
+        start = time.perf_counter()
+        waited = False
+        while True:
+            try:
+                connection = self.pool.get_connection()
+                break
+            except mysql.connector.errors.PoolError:
+                if time.perf_counter() - start >= timeout:
+                    raise
+                if not waited:
+                    waited = True
+                    self._count("waits")
+                time.sleep(self.WAIT_INTERVAL)
+        if waited:
+            self._count("wait_seconds", time.perf_counter() - start)
 
-class MySQLConnectionPool:
-    def __init__(self):
         try:
-            self.pool = mysql.connector.pooling.MySQLConnectionPool(
-                pool_name=POOL_NAME, pool_size=POOL_SIZE, **DB_CONFIG
-            )
-            logger.info("Connection pool created successfully")
-        except mysql.connector.Error as err:
-            logger.error(f"Error creating connection pool: {err}")
-            raise
+            connection.ping(reconnect=False)
+        except mysql.connector.Error:
+            logger.info("끊어진 연결을 다시 연결합니다.")
+            connection.reconnect(attempts=POOL_RECONNECT_ATTEMPTS, delay=1)
+            self._count("reconnects")
+            self._count("created")
+        self._count("checkouts")
+        return connection
+
+
+_shared_pool: Optional[SharedConnectionPool] = None
+_shared_pool_pid: Optional[int] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool() -> SharedConnectionPool:
+    """
+    프로세스 공용 연결 풀을 반환합니다. (처음 사용할 때 생성)
+    다른 프로세스(fork)에서 물려받은 풀은 소켓을 공유하지 않도록 새로 만듭니다.
+    """
+    global _shared_pool, _shared_pool_pid
+    if _shared_pool is None or _shared_pool_pid != os.getpid():
+        with _shared_pool_lock:
+            if _shared_pool is None or _shared_pool_pid != os.getpid():
+                try:
+                    _shared_pool = SharedConnectionPool()
+                    _shared_pool_pid = os.getpid()
+                    logger.info("Connection pool created successfully")
+                except mysql.connector.Error as err:
+                    logger.error(f"Error creating connection pool: {err}")
+                    raise
+    return _shared_pool
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    공용 연결 풀 통계(생성된 연결, 체크아웃, 대기, 재연결 횟수)를 반환합니다.
+    """
+    if _shared_pool is None or _shared_pool_pid != os.getpid():
+        return {}
+    with _shared_pool._lock:
+        return dict(_shared_pool.stats)
+
+
+class MySQLConnectionPool:
+    """
+    공용 연결 풀에서 연결 하나를 빌려 쓰는 컨텍스트 매니저입니다.
+    (with 블록이 끝나면 연결을 풀에 돌려줌)
+    buffered 가 False 이면 결과를 서버에서 필요한 만큼씩 읽는 커서를 사용합니다.
+    """
+
+    def __init__(self, buffered: bool = True):
+        self.pool = get_shared_pool()
+        self.buffered = buffered
+        self.connection = None
+        self.cursor = None
 
     def __enter__(self):
         try:
             self.connection = self.pool.get_connection()
-            self.cursor = self.connection.cursor(buffered=True)
+            self.cursor = self.connection.cursor(buffered=self.buffered)
             logger.info("Connection acquired from pool")
             return self
         except mysql.connector.Error as err:
             logger.error(f"Error acquiring connection from pool: {err}")
+            if self.connection:
+                self.connection.close()
             raise
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # 비버퍼 커서로 다 읽지 않은 결과가 남아 있으면 버려야 커서를 닫고 연결을 재사용할 수 있음
+        if self.connection and not self.buffered and self.connection.unread_result:
+            self.connection.consume_results()
         if self.cursor:
             self.cursor.close()
         if self.connection:
             self.connection.close()
         logger.info("Connection returned to pool")
 
-    def execute_query(self, query: str, params: tuple = None):
+    def execute_query(self, query: str, params: tuple = None, commit: bool = True):
+        """
+        쿼리를 실행합니다. commit 이 False 이면 커밋하지 않으므로
+        여러 쿼리를 commit() 으로 한 트랜잭션으로 묶을 수 있습니다. (실패 시 롤백)
+        """
         try:
             if params:
                 self.cursor.execute(query, params)
             else:
                 self.cursor.execute(query)
-            self.connection.commit()
+            if commit:
+                self.connection.commit()
         except mysql.connector.Error as err:
             logger.error(f"Error executing query: {err}")
             self.connection.rollback()
             raise
 
+    def commit(self):
+        self.connection.commit()
+
     def executemany(self, query: str, params: List[tuple]):
         try:
             self.cursor.executemany(query, params)
@@ -67,169 +203,628 @@ class MySQLConnectionPool:
 
 
 def create_tables():
-    order_type_table = f"""
-    CREATE TABLE IF NOT EXISTS {ORDER_TYPE_TABLE} (
-        EDI_Order_Type VARCHAR(255) PRIMARY KEY,
-        Detailed_Order_Type VARCHAR(255)
-    )
     """
-    receiving_tat_table = f"""
-    CREATE TABLE IF NOT EXISTS {RECEIVING_TAT_REPORT_TABLE} (
-        Cust_Sys_No VARCHAR(255) PRIMARY KEY,
-        ReceiptNo VARCHAR(255),
-        Replen_Balance_Order BIGINT,
-        Allocated_Part VARCHAR(255),
-        EDI_Order_Type VARCHAR(255),
-        ShipFromCode VARCHAR(255),
-        ShipToCode VARCHAR(255),
-        Country VARCHAR(255),
-        Quantity BIGINT,
-        PutAwayDate DATETIME,
-        InventoryDate DATE,
-        FY VARCHAR(20),
-        Quarter VARCHAR(10),
-        Month VARCHAR(2),
-        Week VARCHAR(10),
-        OrderType VARCHAR(255),
-        Count_PO INT,
-        FOREIGN KEY (EDI_Order_Type) REFERENCES {ORDER_TYPE_TABLE}(EDI_Order_Type)
-    )
+    마이그레이션으로 공용 테이블과 Receiving_TAT_Report 스키마를 최신 버전으로 맞춥니다.
+    (DimDate 는 마이그레이션에서 한 번만 채우며, 이미 최신이면 버전만 확인)
     """
     with MySQLConnectionPool() as conn:
-        conn.execute_query(order_type_table)
-        conn.execute_query(receiving_tat_table)
+        run_migrations(conn, [RECEIVING_TAT_REPORT_TABLE])
     logger.info("Tables created successfully")
 
 
-def upload_to_mysql(df: pd.DataFrame):
+def country_table_name(country: str) -> str:
+    """
+    국가별 Receiving_TAT_Report 테이블 이름을 반환합니다. (KR 은 기존 테이블)
+    """
+    if not re.fullmatch(r"[A-Za-z0-9]+", country):
+        raise ValueError(f"테이블 이름으로 사용할 수 없는 국가 코드입니다: {country}")
+    if country.upper() == "KR":
+        return RECEIVING_TAT_REPORT_TABLE
+    return f"{RECEIVING_TAT_REPORT_TABLE}_{country.upper()}"
+
+
+def create_country_tables(countries: List[str]):
+    """
+    국가별 Receiving_TAT_Report 테이블을 마이그레이션으로 만들고 최신 버전으로 맞춥니다.
+    """
+    with MySQLConnectionPool() as conn:
+        run_migrations(conn, [country_table_name(country) for country in countries])
+    logger.info(f"Country tables created: {countries}")
+
+
+class LoadLedger:
+    """
+    원본 파일(내용 해시)별로 어떤 Cust_Sys_No 가 테이블에 반영되었는지 기록합니다.
+    행 기록은 데이터 업로드와 같은 트랜잭션으로 커밋하므로, 중간에 실패한 업로드를
+    다시 실행하면 아직 반영되지 않은 행만 보냅니다.
+    """
+
+    def __init__(self, source_hash: str, source_name: str, table_name: str):
+        self.source_hash = source_hash
+        self.source_name = source_name
+        self.table_name = table_name
+
+    def is_completed(self, conn: MySQLConnectionPool) -> bool:
+        conn.execute_query(
+            f"""
+            SELECT Completed FROM {LOAD_LEDGER_TABLE}
+            WHERE Source_Hash = %s AND Table_Name = %s
+            """,
+            (self.source_hash, self.table_name),
+        )
+        row = conn.cursor.fetchone()
+        return bool(row and row[0])
+
+    def applied_keys(self, conn: MySQLConnectionPool) -> Set[str]:
+        conn.execute_query(
+            f"""
+            SELECT Cust_Sys_No FROM {LOAD_LEDGER_ROWS_TABLE}
+            WHERE Source_Hash = %s AND Table_Name = %s
+            """,
+            (self.source_hash, self.table_name),
+        )
+        return {key for (key,) in conn.cursor.fetchall()}
+
+    def start(self, conn: MySQLConnectionPool, row_count: int):
+        conn.execute_query(
+            f"""
+            INSERT INTO {LOAD_LEDGER_TABLE}
+                (Source_Hash, Table_Name, Source_Name, Row_Count, Completed, Started_At)
+            VALUES (%s, %s, %s, %s, 0, %s)
+            ON DUPLICATE KEY UPDATE Source_Name=VALUES(Source_Name),
+                Row_Count=VALUES(Row_Count), Started_At=VALUES(Started_At)
+            """,
+            (
+                self.source_hash,
+                self.table_name,
+                self.source_name,
+                row_count,
+                datetime.now(),
+            ),
+        )
+
+    def record_rows(self, conn: MySQLConnectionPool, keys: List[str]):
+        """
+        반영한 Cust_Sys_No 를 기록합니다. (커밋하지 않음)
+        """
+        if not keys:
+            return
+        placeholders = ", ".join(["(%s, %s, %s)"] * len(keys))
+        params = tuple(
+            value for key in keys for value in (self.source_hash, self.table_name, key)
+        )
+        conn.execute_query(
+            f"""
+            INSERT IGNORE INTO {LOAD_LEDGER_ROWS_TABLE}
+                (Source_Hash, Table_Name, Cust_Sys_No)
+            VALUES {placeholders}
+            """,
+            params,
+            commit=False,
+        )
+
+    def record_table_rows(self, conn: MySQLConnectionPool, source_table: str):
+        """
+        source_table 의 Cust_Sys_No 를 반영한 행으로 기록합니다. (커밋하지 않음)
+        """
+        conn.execute_query(
+            f"""
+            INSERT IGNORE INTO {LOAD_LEDGER_ROWS_TABLE}
+                (Source_Hash, Table_Name, Cust_Sys_No)
+            SELECT %s, %s, Cust_Sys_No FROM {source_table}
+            """,
+            (self.source_hash, self.table_name),
+            commit=False,
+        )
+
+    def complete(self, conn: MySQLConnectionPool):
+        conn.execute_query(
+            f"""
+            UPDATE {LOAD_LEDGER_TABLE} SET Completed = 1, Completed_At = %s
+            WHERE Source_Hash = %s AND Table_Name = %s
+            """,
+            (datetime.now(), self.source_hash, self.table_name),
+        )
+
+
+def fetch_stored_rows(
+    conn: MySQLConnectionPool,
+    table_name: str,
+    keys: List[str],
+    columns: List[str],
+    batch_size: int = UPLOAD_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """
+    keys 에 해당하는 행의 저장된 columns 값을 batch_size 개씩 한 번에 조회합니다.
+    (Cust_Sys_No 인덱스, 테이블에 없는 키는 결과에 없음)
+    """
+    rows: List[tuple] = []
+    for offset in range(0, len(keys), batch_size):
+        batch = keys[offset : offset + batch_size]
+        placeholders = ", ".join(["%s"] * len(batch))
+        conn.execute_query(
+            f"""
+            SELECT Cust_Sys_No, {", ".join(columns)} FROM {table_name}
+            WHERE Cust_Sys_No IN ({placeholders})
+            """,
+            tuple(batch),
+        )
+        rows.extend(conn.cursor.fetchall())
+    stored = pd.DataFrame.from_records(rows, columns=["Cust_Sys_No"] + columns)
+    stored = stored.set_index(stored["Cust_Sys_No"].astype(object))
+    return stored.drop(columns="Cust_Sys_No")
+
+
+def diff_against_stored(
+    conn: MySQLConnectionPool,
+    df: pd.DataFrame,
+    table_name: str,
+    data_columns: List[str],
+) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """
+    행 내용의 해시(Row_Hash)를 계산하고, 저장된 해시와 같아 업로드해도 바뀌는 것이 없는
+    행(skipped)을 제외합니다. 값을 교체하는 업로드(accumulate=False)에서만 사용합니다.
+    (Quantity/Count_PO 를 더하는 업로드는 기존 키의 값이 항상 바뀌므로 건너뛸 행이 없음)
+    (inserted: 새 키, updated: 저장된 값이 바뀌는 기존 키, 저장된 해시가 없는 행도 updated)
+    """
+    keys = df["Cust_Sys_No"]
+    stored = fetch_stored_rows(conn, table_name, keys.tolist(), [ROW_HASH_COLUMN])
+    stored = stored[~stored.index.duplicated()]
+    exists = keys.isin(stored.index).to_numpy()
+    stored_hashes = stored[ROW_HASH_COLUMN].reindex(keys.to_numpy()).astype("UInt64")
+    hashes = row_hashes(df, data_columns)
+
+    unchanged = (
+        exists
+        & stored_hashes.notna().to_numpy()
+        & (
+            stored_hashes.to_numpy(dtype=np.uint64, na_value=0)
+            == hashes.to_numpy(dtype=np.uint64)
+        )
+    )
+    counts = {
+        "inserted": int((~exists).sum()),
+        "updated": int((exists & ~unchanged).sum()),
+        "skipped": int(unchanged.sum()),
+    }
+    result = df.assign(**{ROW_HASH_COLUMN: hashes.to_numpy()})
+    return result[~unchanged], counts
+
+
+def update_order_types(conn: MySQLConnectionPool):
+    for edi_type, detailed_type in ORDER_TYPE_MAPPING.items():
+        query = f"""
+        INSERT INTO {ORDER_TYPE_TABLE} (EDI_Order_Type, Detailed_Order_Type)
+        VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE Detailed_Order_Type=VALUES(Detailed_Order_Type)
+        """
+        conn.execute_query(query, (edi_type, detailed_type))
+
+
+def _upsert_assignments(columns: List[str], accumulate: bool = True) -> str:
+    """
+    ON DUPLICATE KEY UPDATE 절을 만듭니다.
+    Quantity 와 Count_PO 는 기존 값에 더하고 나머지 컬럼은 새 값으로 바꿉니다.
+    accumulate 가 False 이면 Quantity 와 Count_PO 도 새 값으로 바꿉니다.
+    (같은 컬럼을 두 번 대입하면 앞의 대입 결과에 더해지므로 한 번씩만 대입)
+    """
+    added = ACCUMULATED_COLUMNS if accumulate else []
+    assignments = [
+        f"{col}=VALUES({col})"
+        for col in columns
+        if col != "Cust_Sys_No" and col not in added
+    ]
+    assignments += [f"{col} = {col} + VALUES({col})" for col in added if col in columns]
+    return ", ".join(assignments)
+
+
+def _multi_row_upsert_query(
+    table_name: str, columns: List[str], row_count: int, accumulate: bool = True
+) -> str:
+    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    return f"""
+    INSERT INTO {table_name} ({", ".join(columns)})
+    VALUES {", ".join([row_placeholders] * row_count)}
+    ON DUPLICATE KEY UPDATE {_upsert_assignments(columns, accumulate)}
+    """
+
+
+def _upload_batched(
+    conn: MySQLConnectionPool,
+    df: pd.DataFrame,
+    columns: List[str],
+    table_name: str,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    ledger: Optional[LoadLedger] = None,
+    accumulate: bool = True,
+) -> Tuple[int, int]:
+    """
+    chunk_size 행씩 여러 행 INSERT ... ON DUPLICATE KEY UPDATE 문 하나로 보내고 청크마다 커밋합니다.
+    청크별 행 수, 보낸 바이트, 초당 행 수를 기록하며,
+    실패하면 해당 청크만 롤백되고 이전 청크까지는 저장된 상태로 남습니다.
+    (ledger 가 있으면 청크의 Cust_Sys_No 도 같은 트랜잭션으로 기록)
+    (보낸 행 수, 영향받은 행 수) 를 반환합니다.
+    """
+    chunk_size = max(1, chunk_size)
+    chunk_count = (len(df) + chunk_size - 1) // chunk_size
+    query = None
+    uploaded = 0
+    affected = 0
+    total_bytes = 0
+    total_start = time.perf_counter()
+
+    for index, offset in enumerate(range(0, len(df), chunk_size), start=1):
+        chunk = df.iloc[offset : offset + chunk_size]
+        start = time.perf_counter()
+
+        # 스키마 타입 그대로 DB 값으로 변환 (날짜 문자열 포맷/문자열 캐스팅 없음)
+        rows = to_db_rows(chunk, columns)
+        if query is None or len(rows) != chunk_size:
+            query = _multi_row_upsert_query(table_name, columns, len(rows), accumulate)
+        params = tuple(value for row in rows for value in row)
+
+        try:
+            conn.execute_query(query, params, commit=False)
+            chunk_affected = conn.cursor.rowcount
+            sent_bytes = len((conn.cursor.statement or "").encode("utf-8"))
+            if ledger:
+                ledger.record_rows(conn, chunk["Cust_Sys_No"].tolist())
+            conn.commit()
+        except mysql.connector.Error:
+            logger.error(
+                f"청크 {index}/{chunk_count} 업로드 실패 "
+                f"(이전 {index - 1}개 청크, {uploaded}행은 커밋됨)"
+            )
+            raise
+
+        elapsed = time.perf_counter() - start
+        uploaded += len(rows)
+        affected += chunk_affected
+        total_bytes += sent_bytes
+        rows_per_second = len(rows) / elapsed if elapsed else 0
+        logger.info(
+            f"청크 {index}/{chunk_count}: {len(rows)}행, {sent_bytes} bytes, "
+            f"{elapsed:.2f}s ({rows_per_second:.0f} rows/s)"
+        )
+
+    total_seconds = time.perf_counter() - total_start
+    rows_per_second = uploaded / total_seconds if total_seconds else 0
+    logger.info(
+        f"batch 업로드: {uploaded}행, {total_bytes} bytes, {chunk_count}개 청크, "
+        f"{total_seconds:.2f}s ({rows_per_second:.0f} rows/s)"
+    )
+    return uploaded, affected
+
+
+def _upload_load_data(
+    conn: MySQLConnectionPool,
+    df: pd.DataFrame,
+    columns: List[str],
+    table_name: str,
+    ledger: Optional[LoadLedger] = None,
+    accumulate: bool = True,
+) -> Tuple[int, int]:
+    """
+    처리 결과를 임시 파일로 저장해 LOAD DATA LOCAL INFILE 로 스테이징 임시 테이블에 적재한 뒤,
+    INSERT ... SELECT ... ON DUPLICATE KEY UPDATE 한 번으로 table_name 에 병합합니다.
+    (ledger 가 있으면 스테이징 테이블의 Cust_Sys_No 도 병합과 같은 트랜잭션으로 기록)
+    (적재한 행 수, 병합으로 영향받은 행 수) 를 반환합니다.
+    """
+    staging_table = f"{table_name}_Staging"
+    column_list = ", ".join(columns)
+
+    handle, path = tempfile.mkstemp(suffix=".tsv")
+    os.close(handle)
+    try:
+        start = time.perf_counter()
+        file_bytes = write_load_data_file(df, columns, path)
+
+        conn.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {staging_table}")
+        conn.execute_query(f"CREATE TEMPORARY TABLE {staging_table} LIKE {table_name}")
+        conn.execute_query(
+            f"""
+            LOAD DATA LOCAL INFILE %s INTO TABLE {staging_table}
+            CHARACTER SET utf8mb4
+            FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+            LINES TERMINATED BY '\\n'
+            ({column_list})
+            """,
+            (path.replace("\\", "/"),),
+        )
+        loaded = conn.cursor.rowcount
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        conn.execute_query(
+            f"""
+            INSERT INTO {table_name} ({column_list})
+            SELECT {column_list} FROM {staging_table}
+            ON DUPLICATE KEY UPDATE {_upsert_assignments(columns, accumulate)}
+            """,
+            commit=False,
+        )
+        affected = conn.cursor.rowcount
+        if ledger:
+            ledger.record_table_rows(conn, staging_table)
+        conn.commit()
+        merge_seconds = time.perf_counter() - start
+        conn.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {staging_table}")
+    finally:
+        os.remove(path)
+
+    logger.info(
+        f"LOAD DATA: {loaded} rows ({file_bytes} bytes) in {load_seconds:.2f}s, "
+        f"merge into {table_name} in {merge_seconds:.2f}s"
+    )
+    return loaded, affected
+
+
+def upload_to_mysql(
+    df: pd.DataFrame,
+    table_name: str = RECEIVING_TAT_REPORT_TABLE,
+    order_types: bool = True,
+    method: Optional[str] = None,
+    source_hash: Optional[str] = None,
+    source_name: str = "",
+    accumulate: bool = True,
+) -> Dict[str, int]:
+    """
+    처리된 데이터를 table_name 테이블에 업로드하고 업로드 요약을 반환합니다.
+    (inserted: 새 행, updated: 내용이 바뀐 행, skipped: 건너뛴 행, uploaded: 보낸 행)
+    order_types 가 False 이면 OrderType 테이블 업데이트를 건너뜁니다.
+    method 는 "load_data" 또는 "batch" 입니다. (None 이면 UPLOAD_METHOD)
+    source_hash(원본 파일 내용 해시)가 있고 LOAD_LEDGER_ENABLED 이면 적재 원장을 확인하여
+    이미 반영된 파일은 건너뛰고, 반영되지 않은 Cust_Sys_No 행만 업로드합니다.
+    accumulate 가 False 이면 Quantity/Count_PO 를 기존 값에 더하지 않고 새 값으로 교체합니다.
+    (증분 적재처럼 키의 전체 값이 다시 들어오는 경우)
+    이때 ROW_HASH_DIFF_ENABLED 이면 행 해시를 Row_Hash 로 저장하고,
+    저장된 해시와 같아 업로드해도 바뀌지 않는 행은 건너뜁니다.
+    더하는 업로드(accumulate=True)는 저장된 행을 조회하지 않으며, inserted/updated 는
+    영향받은 행 수(새 행 1, 바뀐 행 2)로 계산합니다. (기존 키는 Count_PO 가 더해져 항상 바뀜)
+    """
     logger.info(f"Original columns in dataframe: {df.columns.tolist()}")
+    method = method or UPLOAD_METHOD
+    summary = {"inserted": 0, "updated": 0, "skipped": 0, "uploaded": 0}
+    ledger = None
+    if source_hash and LOAD_LEDGER_ENABLED:
+        ledger = LoadLedger(source_hash, source_name, table_name)
 
     with MySQLConnectionPool() as conn:
         # OrderType 테이블 업데이트 (기존 코드 유지)
-        for edi_type, detailed_type in ORDER_TYPE_MAPPING.items():
-            query = f"""
-            INSERT INTO {ORDER_TYPE_TABLE} (EDI_Order_Type, Detailed_Order_Type)
-            VALUES (%s, %s)
-            ON DUPLICATE KEY UPDATE Detailed_Order_Type=VALUES(Detailed_Order_Type)
-            """
-            conn.execute_query(query, (edi_type, detailed_type))
+        if order_types:
+            update_order_types(conn)
+
+        if ledger:
+            if ledger.is_completed(conn):
+                logger.info(f"이미 {table_name} 에 반영된 파일입니다: {source_name}")
+                summary["skipped"] = len(df)
+                return summary
+            applied = ledger.applied_keys(conn)
+            if applied:
+                row_count = len(df)
+                df = df[~df["Cust_Sys_No"].isin(applied)]
+                summary["skipped"] += row_count - len(df)
+                logger.info(
+                    f"이전 업로드에서 반영된 {row_count - len(df)}개 행을 제외합니다. "
+                    f"(남은 행 {len(df)}개)"
+                )
+            ledger.start(conn, len(df))
 
         # Receiving_TAT_Report 테이블 업데이트
-        insert_columns = [
-            "Cust_Sys_No",
-            "ReceiptNo",
-            "Replen_Balance_Order",
-            "Allocated_Part",
-            "EDI_Order_Type",
-            "ShipFromCode",
-            "ShipToCode",
-            "Country",
-            "Quantity",
-            "PutAwayDate",
-            "InventoryDate",
-            "FY",
-            "Quarter",
-            "Month",
-            "Week",
-            "OrderType",
-            "Count_PO",
+        data_columns = [
+            col
+            for col in RECEIVING_TAT_COLUMNS
+            if col in df.columns and col != ROW_HASH_COLUMN
         ]
-
-        existing_columns = [col for col in insert_columns if col in df.columns]
+        existing_columns = data_columns + [ROW_HASH_COLUMN]
         logger.info(f"Columns to be inserted: {existing_columns}")
 
-        insert_placeholders = ", ".join(["%s"] * len(existing_columns))
-        update_placeholders = ", ".join(
-            [f"{col}=VALUES({col})" for col in existing_columns if col != "Cust_Sys_No"]
-        )
+        diff = ROW_HASH_DIFF_ENABLED and not accumulate
+        if diff:
+            df, counts = diff_against_stored(conn, df, table_name, data_columns)
+            summary["inserted"] = counts["inserted"]
+            summary["updated"] = counts["updated"]
+            summary["skipped"] += counts["skipped"]
+        else:
+            # 저장된 값을 모르면 업로드 후 값의 해시도 알 수 없으므로 비워 둠
+            unknown = pd.array([None] * len(df), dtype="UInt64")
+            df = df.assign(**{ROW_HASH_COLUMN: unknown})
+
+        result = (0, 0) if df.empty else None
+        if result is None and method == "load_data":
+            try:
+                result = _upload_load_data(
+                    conn,
+                    df,
+                    existing_columns,
+                    table_name,
+                    ledger=ledger,
+                    accumulate=accumulate,
+                )
+            except mysql.connector.Error as err:
+                if err.errno not in LOAD_DATA_DISABLED_ERRORS:
+                    raise
+                logger.warning(
+                    "LOAD DATA LOCAL INFILE 을 사용할 수 없어 "
+                    f"batch 방식으로 업로드합니다: {err}"
+                )
+        if result is None:
+            result = _upload_batched(
+                conn,
+                df,
+                existing_columns,
+                table_name,
+                ledger=ledger,
+                accumulate=accumulate,
+            )
 
-        # Quantity와 Count_PO에 대해 특별 처리
-        update_placeholders += ", Quantity = Quantity + VALUES(Quantity)"
-        update_placeholders += ", Count_PO = Count_PO + VALUES(Count_PO)"
+        if ledger:
+            ledger.complete(conn)
+
+    uploaded, affected = result
+    summary["uploaded"] = uploaded
+    if not diff:
+        summary["updated"] = min(uploaded, max(0, affected - uploaded))
+        summary["inserted"] = uploaded - summary["updated"]
+    logger.info(
+        f"{table_name} 업로드 요약: 새 행 {summary['inserted']}, "
+        f"변경 {summary['updated']}, 건너뜀 {summary['skipped']}, "
+        f"전송 {summary['uploaded']}"
+    )
+    return summary
 
-        insert_query = f"""
-        INSERT INTO {RECEIVING_TAT_REPORT_TABLE} ({", ".join(existing_columns)}) 
-        VALUES ({insert_placeholders})
-        ON DUPLICATE KEY UPDATE {update_placeholders}
-        """
 
-        # 데이터 전처리 (기존 코드 유지)
-        df_to_insert = df.reindex(columns=existing_columns, fill_value=None)
+def upload_country_partitions(
+    partitions: Dict[str, pd.DataFrame],
+    max_workers: Optional[int] = None,
+    source_hash: Optional[str] = None,
+    source_name: str = "",
+    accumulate: bool = True,
+) -> Dict[str, Dict[str, int]]:
+    """
+    국가별 처리 결과를 국가별 테이블에 동시에 업로드하고 국가별 업로드 요약을 반환합니다.
+    (OrderType 테이블은 업로드 전에 한 번만 업데이트, accumulate 는 upload_to_mysql 과 같음)
+    """
+    create_country_tables(list(partitions))
+    with MySQLConnectionPool() as conn:
+        update_order_types(conn)
+
+    workers = max(1, min(max_workers or UPLOAD_WORKERS, len(partitions)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            country: executor.submit(
+                upload_to_mysql,
+                df,
+                country_table_name(country),
+                order_types=False,
+                source_hash=source_hash,
+                source_name=source_name,
+                accumulate=accumulate,
+            )
+            for country, df in partitions.items()
+        }
+        return {country: future.result() for country, future in futures.items()}
 
-        datetime_cols = ["PutAwayDate", "InventoryDate"]
-        for col in datetime_cols:
-            if col in df_to_insert.columns:
-                df_to_insert[col] = pd.to_datetime(df_to_insert[col]).dt.strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
 
-        if "Replen_Balance_Order" in df_to_insert.columns:
-            df_to_insert["Replen_Balance_Order"] = df_to_insert[
-                "Replen_Balance_Order"
-            ].astype(str)
+def _rows_to_frame(rows: List[tuple], columns: List[str]) -> pd.DataFrame:
+    """
+    행 튜플 목록을 컬럼별 배열로 바꿔 데이터프레임을 만듭니다. (행별 dict 를 만들지 않음)
+    """
+    if not rows:
+        return pd.DataFrame(columns=columns)
+    return pd.DataFrame(
+        {col: list(values) for col, values in zip(columns, zip(*rows))},
+        columns=columns,
+    )
 
-        df_to_insert = df_to_insert.where(pd.notna(df_to_insert), None)
 
-        data_to_insert = df_to_insert.values.tolist()
+def stream_query(
+    query: str, params: tuple = None, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    쿼리 결과를 비버퍼 커서의 fetchmany 로 chunk_size 행씩 읽어 데이터프레임 청크로 반환합니다.
+    전체 결과를 클라이언트 메모리에 올리지 않으며, 모두 읽을 때까지 연결 하나를 사용합니다.
+    """
+    with MySQLConnectionPool(buffered=False) as conn:
+        conn.execute_query(query, params, commit=False)
+        columns = [i[0] for i in conn.cursor.description]
+        while True:
+            rows = conn.cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield _rows_to_frame(rows, columns)
 
-        conn.executemany(insert_query, data_to_insert)
 
-    logger.info(f"{len(data_to_insert)} rows uploaded to database")
+def read_query(
+    query: str, params: tuple = None, chunk_size: int = READ_CHUNK_SIZE
+) -> pd.DataFrame:
+    """
+    쿼리 결과를 비버퍼 커서로 chunk_size 행씩 읽어 컬럼별 배열에 모은 뒤
+    데이터프레임 하나로 반환합니다.
+    """
+    with MySQLConnectionPool(buffered=False) as conn:
+        conn.execute_query(query, params, commit=False)
+        columns = [i[0] for i in conn.cursor.description]
+        values: List[list] = [[] for _ in columns]
+        while True:
+            rows = conn.cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            for target, column in zip(values, zip(*rows)):
+                target.extend(column)
+    return pd.DataFrame(dict(zip(columns, values)), columns=columns)
+
+
+def stream_table(
+    table_name: str, chunk_size: int = READ_CHUNK_SIZE, key: str = "Cust_Sys_No"
+) -> Iterator[pd.DataFrame]:
+    """
+    테이블 전체를 기본 키(key) 순서로 chunk_size 행씩 나눠 데이터프레임 청크로 반환합니다.
+    (keyset pagination: 페이지마다 마지막 키 다음부터 PK 인덱스로 조회하므로
+    OFFSET 처럼 앞 행을 다시 읽지 않고, 페이지 사이에는 연결을 풀에 돌려줌)
+    """
+    last_key = None
+    while True:
+        if last_key is None:
+            query = f"SELECT * FROM {table_name} ORDER BY {key} LIMIT %s"
+            params = (chunk_size,)
+        else:
+            query = (
+                f"SELECT * FROM {table_name} WHERE {key} > %s "
+                f"ORDER BY {key} LIMIT %s"
+            )
+            params = (last_key, chunk_size)
+        chunk = read_query(query, params, chunk_size)
+        if chunk.empty:
+            return
+        yield chunk
+        if len(chunk) < chunk_size:
+            return
+        last_key = chunk[key].iloc[-1]
 
 
 def get_db_data() -> pd.DataFrame:
     try:
-        with MySQLConnectionPool() as conn:
-            query = f"SELECT * FROM {RECEIVING_TAT_REPORT_TABLE}"
-            conn.execute_query(query)
-            result = conn.cursor.fetchall()
-            columns = [i[0] for i in conn.cursor.description]
-            return pd.DataFrame(result, columns=columns)
+        chunks = list(stream_table(RECEIVING_TAT_REPORT_TABLE))
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
     except Exception as e:
         logger.error(f"Error fetching data from database: {str(e)}")
         return pd.DataFrame()
 
 
 def get_data_by_date(start_date: str, end_date: str) -> pd.DataFrame:
-    with MySQLConnectionPool() as conn:
-        query = f"""
-        SELECT * FROM {RECEIVING_TAT_REPORT_TABLE}
-        WHERE PutAwayDate BETWEEN %s AND %s
-        """
-        conn.execute_query(query, (start_date, end_date))
-        result = conn.cursor.fetchall()
-        columns = [i[0] for i in conn.cursor.description]
-        return pd.DataFrame(result, columns=columns)
+    query = f"""
+    SELECT * FROM {RECEIVING_TAT_REPORT_TABLE}
+    WHERE PutAwayDate BETWEEN %s AND %s
+    """
+    return read_query(query, (start_date, end_date))
+
+
+def get_data_by_fy_and_quarter(fy: str, quarter: str) -> pd.DataFrame:
+    """
+    DimDate 와 조인하여 지정한 회계연도/분기의 데이터를 조회합니다.
+    """
+    query = f"""
+    SELECT r.* FROM {RECEIVING_TAT_REPORT_TABLE} r
+    JOIN {DIM_DATE_TABLE} d ON d.Date = r.InventoryDate
+    WHERE d.FY = %s AND d.Quarter = %s
+    """
+    return read_query(query, (fy, quarter))
 
 
 def get_data_by_inventory_date(start_date, end_date):
-    connection = None
     try:
-        logger.info("데이터베이스 연결 시도 중...")
-        connection = mysql.connector.connect(**DB_CONFIG)
-        logger.info("데이터베이스 연결 성공")
-
-        cursor = connection.cursor(dictionary=True)
-        
-        query = """
-        SELECT * FROM Receiving_TAT_Report
+        query = f"""
+        SELECT * FROM {RECEIVING_TAT_REPORT_TABLE}
         WHERE InventoryDate BETWEEN %s AND %s
         """
         logger.info(f"쿼리 실행 중: {query}")
-        cursor.execute(query, (start_date, end_date))
-        
-        logger.info("쿼리 결과 가져오는 중...")
-        result = cursor.fetchall()
-        logger.info(f"총 {len(result)}개의 레코드 검색됨")
-
-        df = pd.DataFrame(result)
+        df = read_query(query, (start_date, end_date))
+        logger.info(f"총 {len(df)}개의 레코드 검색됨")
         return df
-    
+
     except mysql.connector.Error as err:
         logger.error(f"데이터베이스 오류: {err}")
         raise
-    finally:
-        if connection and connection.is_connected():
-            cursor.close()
-            connection.close()
-            logger.info("데이터베이스 연결 종료")
\ No newline at end of file
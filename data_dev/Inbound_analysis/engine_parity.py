@@ -0,0 +1,93 @@
+import glob
+import os
+import time
+
+import pandas as pd
+from main import setup_config, read_excel
+from data_processor import main_data_processing, main_data_processing_parallel
+
+# pandas 엔진과 polars 엔진, 직렬 처리와 병렬(PROCESSING_MODE="parallel") 처리의
+# 결과(데이터프레임, 통계)를 샘플 파일로 비교하는 스크립트
+
+# 병렬 처리 비교에 쓰는 프로세스 수 (CPU 수와 관계없이 파티션을 나눠 비교)
+PARALLEL_WORKERS = 4
+
+SAMPLE_FOLDER = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "download", "xlsx_files"
+)
+
+
+def run_engine(df: pd.DataFrame, engine: str):
+    config = {**setup_config(), "PROCESSING_ENGINE": engine}
+    start = time.perf_counter()
+    processed_df, stats = main_data_processing(df.copy(), config)
+    elapsed = time.perf_counter() - start
+    stats = {k: v for k, v in stats.items() if k != "stage_metrics"}
+    return processed_df, stats, elapsed
+
+
+def run_parallel(df: pd.DataFrame):
+    config = {**setup_config(), "PROCESSING_ENGINE": "pandas"}
+    start = time.perf_counter()
+    processed_df, stats = main_data_processing_parallel(
+        df.copy(), config, max_workers=PARALLEL_WORKERS
+    )
+    elapsed = time.perf_counter() - start
+    stats = {
+        k: v for k, v in stats.items() if k not in ("stage_metrics", "partition_count")
+    }
+    return processed_df, stats, elapsed
+
+
+def compare_results(label: str, expected, actual) -> bool:
+    expected_df, expected_stats = expected
+    actual_df, actual_stats = actual
+    try:
+        pd.testing.assert_frame_equal(expected_df, actual_df)
+    except AssertionError as e:
+        print(f"{label} 데이터프레임 불일치: {e}")
+        return False
+    if expected_stats != actual_stats:
+        print(f"{label} 통계 불일치: {expected_stats} != {actual_stats}")
+        return False
+    return True
+
+
+def compare_engines(file_path: str) -> bool:
+    df = read_excel(file_path, "CS Receiving TAT")
+    if df is None or df.empty:
+        print(f"파일을 읽지 못했습니다: {file_path}")
+        return False
+
+    pandas_df, pandas_stats, pandas_time = run_engine(df, "pandas")
+    polars_df, polars_stats, polars_time = run_engine(df, "polars")
+    parallel_df, parallel_stats, parallel_time = run_parallel(df)
+
+    print(f"\n{os.path.basename(file_path)} ({len(df)}행)")
+    print(
+        f"pandas: {pandas_time:.2f}초, polars: {polars_time:.2f}초, "
+        f"병렬: {parallel_time:.2f}초"
+    )
+
+    expected = (pandas_df, pandas_stats)
+    if not compare_results("polars", expected, (polars_df, polars_stats)):
+        return False
+    if not compare_results("병렬", expected, (parallel_df, parallel_stats)):
+        return False
+
+    print("결과 일치")
+    return True
+
+
+def main():
+    files = sorted(glob.glob(os.path.join(SAMPLE_FOLDER, "*.xlsx")))
+    if not files:
+        print(f"샘플 파일이 없습니다: {SAMPLE_FOLDER}")
+        return
+
+    results = [compare_engines(file_path) for file_path in files]
+    print(f"\n{sum(results)}/{len(results)}개 파일 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
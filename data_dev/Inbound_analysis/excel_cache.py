@@ -0,0 +1,244 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+from config import CACHE_FOLDER, CACHE_MAX_BYTES, EXCEL_CACHE_ENABLED
+from excel_reader import read_excel_streaming
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE_NAME = "index.json"
+INDEX_LOCK_FILE_NAME = "index.lock"
+CACHE_EXTENSIONS = (".parquet", ".pkl")
+
+# 인덱스 잠금 대기 시간 (초)과, 잠금 파일이 이보다 오래되면 중단된 프로세스가
+# 남긴 것으로 보고 삭제하는 시간 (초)
+INDEX_LOCK_TIMEOUT = 30.0
+INDEX_LOCK_STALE_SECONDS = 60.0
+
+
+def file_sha256(filepath: str, block_size: int = 1024 * 1024) -> str:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_index() -> Dict[str, Any]:
+    index_path = os.path.join(CACHE_FOLDER, INDEX_FILE_NAME)
+    if not os.path.exists(index_path):
+        return {}
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        logger.warning("캐시 인덱스를 읽을 수 없어 새로 생성합니다.")
+        return {}
+
+
+@contextmanager
+def _index_lock(timeout: float = INDEX_LOCK_TIMEOUT) -> Iterator[None]:
+    """
+    잠금 파일을 만들어 여러 프로세스의 인덱스 읽기-수정-저장을 하나씩 실행합니다.
+    (batch_main 의 프로세스 풀 작업이 동시에 인덱스를 갱신해도 항목이 사라지지 않도록)
+    """
+    lock_path = os.path.join(CACHE_FOLDER, INDEX_LOCK_FILE_NAME)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                age = time.time() - os.path.getmtime(lock_path)
+            except FileNotFoundError:
+                continue  # 그 사이에 잠금이 풀림
+            if age > INDEX_LOCK_STALE_SECONDS:
+                logger.warning(f"오래된 캐시 인덱스 잠금을 삭제합니다: {lock_path}")
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+                continue
+            if time.time() > deadline:
+                raise TimeoutError(f"캐시 인덱스 잠금을 얻지 못했습니다: {lock_path}")
+            time.sleep(0.05)
+    try:
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        os.close(fd)
+        yield
+    finally:
+        os.remove(lock_path)
+
+
+def _save_index(index: Dict[str, Any]) -> None:
+    """
+    인덱스를 임시 파일에 쓴 뒤 교체합니다. (_index_lock 안에서 호출)
+    """
+    # 이동되거나 삭제된 파일의 항목은 제거
+    index = {path: entry for path, entry in index.items() if os.path.exists(path)}
+    index_path = os.path.join(CACHE_FOLDER, INDEX_FILE_NAME)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, index_path)
+
+
+def get_content_hash(filepath: str, index: Optional[Dict[str, Any]] = None) -> str:
+    """
+    파일 해시를 반환합니다. 크기와 수정 시각이 같으면 인덱스에 저장된 값을 재사용합니다.
+    """
+    index = _load_index() if index is None else index
+    stat = os.stat(filepath)
+    entry = index.get(os.path.abspath(filepath))
+    if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+        return entry["hash"]
+    return file_sha256(filepath)
+
+
+def _entry_base(content_hash: str, sheet_name: str, variant: str = "") -> str:
+    key = hashlib.sha256(f"{sheet_name}|{variant}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(CACHE_FOLDER, f"{content_hash}_{key}")
+
+
+def _find_entry(base: str) -> Optional[str]:
+    for ext in CACHE_EXTENSIONS:
+        if os.path.exists(base + ext):
+            return base + ext
+    return None
+
+
+def _read_entry(path: str) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+        # Parquet 은 문자열 컬럼의 결측값을 None 으로 돌려주므로 원본과 같이 NaN 으로 맞춤
+        for col in df.columns:
+            if pd.api.types.is_object_dtype(df[col]):
+                df[col] = df[col].where(df[col].notna(), np.nan)
+        return df
+    return pd.read_pickle(path)
+
+
+def _write_entry(df: pd.DataFrame, base: str) -> str:
+    """
+    Parquet 으로 저장하고, pyarrow 가 없거나 혼합 타입 컬럼이 있으면 pickle 로 저장합니다.
+    """
+    suffix = f".{os.getpid()}.tmp"
+    try:
+        path = base + ".parquet"
+        df.to_parquet(path + suffix, index=False)
+    except Exception as e:
+        logger.info(f"Parquet 저장 불가, pickle 로 대체합니다: {str(e)}")
+        if os.path.exists(base + ".parquet" + suffix):
+            os.remove(base + ".parquet" + suffix)
+        path = base + ".pkl"
+        df.to_pickle(path + suffix)
+    os.replace(path + suffix, path)
+    return path
+
+
+def _evict(max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """
+    캐시 전체 크기가 max_bytes 를 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+    """
+    entries = []
+    for name in os.listdir(CACHE_FOLDER):
+        if name.endswith(CACHE_EXTENSIONS):
+            path = os.path.join(CACHE_FOLDER, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass  # 다른 프로세스가 이미 삭제함
+        total -= size
+        logger.info(f"캐시 항목 삭제 (LRU): {os.path.basename(path)}")
+
+
+def _record_file(abs_path: str, content_hash: str) -> None:
+    """
+    잠금 안에서 최신 인덱스를 다시 읽어 abs_path 의 해시를 기록합니다.
+    파일 내용이 바뀌었으면 이전 내용의 캐시 항목을 삭제하되,
+    같은 내용을 가리키는 다른 경로가 남아 있으면 유지합니다.
+    """
+    with _index_lock():
+        index = _load_index()
+        previous = index.get(abs_path)
+        stat = os.stat(abs_path)
+        index[abs_path] = {
+            "hash": content_hash,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+
+        if previous and previous["hash"] != content_hash:
+            referenced = any(
+                entry["hash"] == previous["hash"]
+                for path, entry in index.items()
+                if os.path.exists(path)
+            )
+            if not referenced:
+                for name in os.listdir(CACHE_FOLDER):
+                    if name.startswith(previous["hash"] + "_"):
+                        try:
+                            os.remove(os.path.join(CACHE_FOLDER, name))
+                        except FileNotFoundError:
+                            pass  # 다른 프로세스가 이미 삭제함
+            logger.info(f"파일 변경 감지, 캐시 무효화: {os.path.basename(abs_path)}")
+
+        _save_index(index)
+
+
+def read_excel_cached(
+    filepath: str,
+    sheet_name: str,
+    loader: Callable[[str, str], pd.DataFrame] = read_excel_streaming,
+    variant: str = "",
+) -> pd.DataFrame:
+    """
+    파일 내용 해시를 키로 파싱된 시트를 캐시에서 읽고, 없으면 loader 로 읽어 캐시에 저장합니다.
+    같은 파일이라도 읽는 방식(variant)이 다르면 별도의 항목으로 저장합니다.
+    """
+    if not EXCEL_CACHE_ENABLED:
+        return loader(filepath, sheet_name)
+
+    os.makedirs(CACHE_FOLDER, exist_ok=True)
+    content_hash = get_content_hash(filepath)
+    _record_file(os.path.abspath(filepath), content_hash)
+
+    base = _entry_base(content_hash, sheet_name, variant)
+    cached_path = _find_entry(base)
+    if cached_path:
+        try:
+            df = _read_entry(cached_path)
+            os.utime(cached_path)
+            logger.info(f"캐시에서 '{sheet_name}' 시트를 읽었습니다: {len(df)} 행")
+            return df
+        except Exception as e:
+            logger.warning(f"캐시 항목을 읽을 수 없어 다시 파싱합니다: {str(e)}")
+            if os.path.exists(cached_path):
+                os.remove(cached_path)
+
+    df = loader(filepath, sheet_name)
+    _write_entry(df, base)
+    _evict()
+    logger.info(f"'{sheet_name}' 시트를 캐시에 저장했습니다: {len(df)} 행")
+    return df
@@ -0,0 +1,247 @@
+import logging
+import warnings
+from typing import Callable, Dict, Iterator, List, Any, Optional
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+from config import (
+    EXCEL_CHUNK_SIZE,
+    COLUMN_MAPPING,
+    CUST_SYS_NO_ALIASES,
+    EXTRA_SOURCE_COLUMNS,
+    SOURCE_DTYPES,
+)
+
+logger = logging.getLogger(__name__)
+
+# pandas.read_excel 과 동일하게 결측값으로 처리할 문자열
+NA_VALUES = {
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+}
+
+
+def _convert_value(value: Any) -> Any:
+    """
+    셀 값 하나를 변환합니다. (빈 셀과 NA_VALUES 문자열은 결측값, 정수인 실수는 int)
+    숫자처럼 보이는 텍스트 셀은 여기서 바꾸지 않고 컬럼 단위로 _infer_numeric 에서 처리합니다.
+    """
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return np.nan if value in NA_VALUES else value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _make_header(row: tuple) -> List[str]:
+    """
+    헤더 행을 컬럼 이름 목록으로 변환합니다. (빈 이름/중복 이름 보정)
+    """
+    header: List[str] = []
+    seen = {}
+    for i, value in enumerate(row):
+        name = f"Unnamed: {i}" if value is None or value == "" else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        header.append(name)
+    return header
+
+
+def resolve_source_columns(header: List[str]) -> Dict[str, str]:
+    """
+    헤더 행에서 처리에 필요한 컬럼만 골라 {원본 컬럼명: 표준 컬럼명} 으로 반환합니다.
+    'Cust Sys No' 는 별칭(CUST_SYS_NO_ALIASES)도 찾아 표준 이름으로 맞춥니다.
+    """
+    wanted = list(COLUMN_MAPPING.keys()) + EXTRA_SOURCE_COLUMNS
+    columns = {name: name for name in header if name in wanted}
+
+    if "Cust Sys No" not in columns:
+        for alias in CUST_SYS_NO_ALIASES:
+            if alias in header:
+                columns[alias] = "Cust Sys No"
+                break
+        else:
+            raise ValueError("'Cust Sys No' 또는 유사한 컬럼을 찾을 수 없습니다.")
+
+    logger.info(f"읽을 컬럼 {len(columns)}/{len(header)}개: {list(columns)}")
+    return columns
+
+
+def _apply_dtype(values: list, kind: str) -> Any:
+    """
+    컬럼 값 목록을 dtype 힌트에 맞게 변환합니다.
+    """
+    if kind == "str":
+        return np.array(
+            [v if isinstance(v, str) or pd.isna(v) else str(v) for v in values],
+            dtype=object,
+        )
+    if kind == "numeric":
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").values
+    if kind == "datetime":
+        return pd.to_datetime(pd.Series(values, dtype=object), errors="coerce").values
+    raise ValueError(f"지원하지 않는 dtype 힌트입니다: {kind}")
+
+
+def _infer_numeric(values: Any) -> Any:
+    """
+    dtype 힌트가 없는 컬럼을 pandas.read_excel 처럼 숫자로 바꿉니다.
+    컬럼의 모든 값이 숫자로 변환될 때만 바꾸고, 하나라도 안 되면 원래 값을 그대로 둡니다.
+    (숫자처럼 보이는 텍스트 셀 "123" 도 숫자가 됨)
+    """
+    series = pd.Series(values, dtype=object)
+    try:
+        return pd.to_numeric(series).values
+    except (ValueError, TypeError):
+        return series.values
+
+
+def _build_chunk(
+    rows: List[list], names: List[str], dtypes: Dict[str, str]
+) -> pd.DataFrame:
+    data = {}
+    for i, name in enumerate(names):
+        values = [row[i] for row in rows]
+        if name in dtypes:
+            data[name] = _apply_dtype(values, dtypes[name])
+        else:
+            data[name] = _infer_numeric(values)
+    return pd.DataFrame(data, columns=names)
+
+
+def iter_excel_chunks(
+    filepath: str,
+    sheet_name: str,
+    chunksize: int = EXCEL_CHUNK_SIZE,
+    select: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    엑셀 시트를 읽기 전용 모드로 한 행씩 읽어 최대 chunksize 행의 데이터프레임으로 반환합니다.
+    메모리 사용량은 시트 전체 크기가 아닌 청크 크기에 비례합니다.
+
+    select 가 주어지면 데이터 행을 읽기 전에 헤더 행만으로 읽을 컬럼을 정하고
+    ({원본 컬럼명: 반환 컬럼명}), 나머지 컬럼은 변환하지 않습니다.
+    dtypes 는 반환 컬럼명 기준의 dtype 힌트("str", "numeric", "datetime")입니다.
+    힌트가 없는 컬럼은 청크마다 pandas.read_excel 과 같은 규칙으로 숫자 변환을 시도하므로,
+    청크별 dtype 이 다를 수 있습니다. (시트 전체 기준은 read_excel_streaming)
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
+        workbook = load_workbook(
+            filepath, read_only=True, data_only=True, keep_links=False
+        )
+    try:
+        sheet = workbook[sheet_name]
+        # 일부 리포트는 잘못된 시트 크기 정보를 저장하므로 다시 계산
+        sheet.reset_dimensions()
+
+        header: List[str] = []
+        positions: List[int] = []
+        names: List[str] = []
+        rows: List[list] = []
+        chunk_count = 0
+        for row in sheet.iter_rows(values_only=True):
+            if all(value is None or value == "" for value in row):
+                continue
+            if not header:
+                header = _make_header(row)
+                columns = select(header) if select else {h: h for h in header}
+                positions = [header.index(h) for h in columns]
+                names = list(columns.values())
+                continue
+
+            width = len(row)
+            rows.append(
+                [_convert_value(row[i]) if i < width else np.nan for i in positions]
+            )
+
+            if len(rows) >= chunksize:
+                chunk_count += 1
+                yield _build_chunk(rows, names, dtypes or {})
+                rows = []
+
+        if rows or chunk_count == 0:
+            chunk_count += 1
+            yield _build_chunk(rows, names, dtypes or {})
+
+        logger.info(f"'{sheet_name}' 시트를 {chunk_count}개 청크로 읽었습니다.")
+    finally:
+        workbook.close()
+
+
+def read_excel_streaming(
+    filepath: str,
+    sheet_name: str,
+    chunksize: int = EXCEL_CHUNK_SIZE,
+    select: Optional[Callable[[List[str]], Dict[str, str]]] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> pd.DataFrame:
+    """
+    스트리밍 방식으로 시트 전체를 읽어 하나의 데이터프레임으로 반환합니다.
+    힌트가 없는 컬럼은 청크를 합친 뒤 컬럼 전체 기준으로 숫자 변환을 다시 판단합니다.
+    """
+    chunks = list(iter_excel_chunks(filepath, sheet_name, chunksize, select, dtypes))
+    if len(chunks) == 1:
+        return chunks[0]
+    df = pd.concat(chunks, ignore_index=True)
+    for name in df.columns:
+        if name not in (dtypes or {}) and pd.api.types.is_object_dtype(df[name]):
+            df[name] = _infer_numeric(df[name])
+    return df
+
+
+def iter_source_chunks(
+    filepath: str, sheet_name: str, chunksize: int = EXCEL_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    COLUMN_MAPPING 에 필요한 원본 컬럼만 dtype 힌트를 적용해 청크 단위로 읽습니다.
+    """
+    return iter_excel_chunks(
+        filepath, sheet_name, chunksize, resolve_source_columns, SOURCE_DTYPES
+    )
+
+
+def read_source_sheet(
+    filepath: str, sheet_name: str, chunksize: int = EXCEL_CHUNK_SIZE
+) -> pd.DataFrame:
+    """
+    COLUMN_MAPPING 에 필요한 원본 컬럼만 dtype 힌트를 적용해 읽습니다.
+    """
+    return read_excel_streaming(
+        filepath, sheet_name, chunksize, resolve_source_columns, SOURCE_DTYPES
+    )
+
+
+# 원본 컬럼 선택/dtype 설정이 바뀌면 캐시 항목도 달라지도록 하는 식별자
+SOURCE_VARIANT = repr(
+    (
+        sorted(COLUMN_MAPPING),
+        CUST_SYS_NO_ALIASES,
+        EXTRA_SOURCE_COLUMNS,
+        sorted(SOURCE_DTYPES.items()),
+    )
+)
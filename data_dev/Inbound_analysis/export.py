@@ -4,6 +4,7 @@ import pandas as pd
 from datetime import datetime
 from config import COMPLETE_FOLDER
 from database import get_data_by_inventory_date
+from schema import enforce_schema
 from openpyxl import load_workbook
 from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
 from openpyxl.utils import get_column_letter
@@ -43,25 +44,24 @@ def get_user_input() -> tuple:
 
 def preprocess_extracted_data(df: pd.DataFrame) -> pd.DataFrame:
     logger.info("추출된 데이터 전처리 시작")
+    # DB 값에 스키마 dtype 적용 (날짜, 정수, category 변환은 여기서 한 번만)
+    df = enforce_schema(df)
     df.columns = df.columns.str.replace(" ", "_").str.lower()
 
-    # putawaydate 처리
-    if "putawaydate" in df.columns:
-        df["putawaydate"] = pd.to_datetime(df["putawaydate"], errors="coerce")
-
     # inventorydate 처리
     if "inventorydate" in df.columns:
-        df["inventorydate"] = pd.to_datetime(df["inventorydate"]).dt.date
         # inventorydate를 'YY-MM-DD' 형식의 문자열로 변환
-        df["inventorydate_str"] = df["inventorydate"].apply(lambda x: x.strftime("%y-%m-%d") if pd.notnull(x) else None)
+        inventory_str = df["inventorydate"].dt.strftime("%y-%m-%d")
+        df["inventorydate_str"] = inventory_str.where(inventory_str.notna(), None)
+        df["inventorydate"] = df["inventorydate"].dt.date
 
     # count_po 처리: null이 아닌 값을 1로, null인 값을 0으로 변경
     if "count_po" in df.columns:
         df["count_po"] = df["count_po"].notnull().astype(int)
 
-    # quantity 처리
-    if "quantity" in df.columns:
-        df["quantity"] = pd.to_numeric(df["quantity"], errors="coerce").fillna(0)
+    # quantity 처리 (NULL 은 0)
+    if "quantity" in df.columns and df["quantity"].hasnans:
+        df["quantity"] = df["quantity"].fillna(0)
 
     # InventoryDate 기준으로 오름차순 정렬
     df = df.sort_values(by="inventorydate")
@@ -73,7 +73,7 @@ def preprocess_extracted_data(df: pd.DataFrame) -> pd.DataFrame:
 def analyze_data(df: pd.DataFrame) -> dict:
     # Weekly Analysis
     weekly_analysis = (
-        df.groupby("week")
+        df.groupby("week", observed=True)
         .agg(
             {
                 "count_po": "sum",
@@ -86,7 +86,7 @@ def analyze_data(df: pd.DataFrame) -> dict:
 
     # ShipTo Analysis
     shipto_analysis = (
-        df.groupby("shiptocode")
+        df.groupby("shiptocode", observed=True)
         .agg(
             {
                 "count_po": "sum",
@@ -1,10 +1,16 @@
 import os
 import time
+import queue
 import shutil
+import fnmatch
 import pandas as pd
 import logging
-from typing import Set, Optional
-from config import DOWNLOAD_TIMEOUT
+from typing import List, Set, Optional
+from watchdog.events import FileSystemEventHandler
+from watchdog.observers import Observer
+from config import DOWNLOAD_TIMEOUT, DOWNLOAD_STABLE_INTERVAL
+from excel_cache import read_excel_cached
+from excel_reader import read_source_sheet, SOURCE_VARIANT
 
 logger = logging.getLogger(__name__)
 
@@ -14,22 +20,121 @@ def get_existing_files(folder: str) -> Set[str]:
     """
     return set(os.listdir(folder))
 
+def find_pending_files(
+    download_folder: str, complete_folder: str, pattern: str
+) -> List[str]:
+    """
+    다운로드 폴더에서 아직 완료 폴더로 옮겨지지 않은 리포트 파일 목록을 반환합니다.
+    """
+    completed = (
+        set(os.listdir(complete_folder)) if os.path.isdir(complete_folder) else set()
+    )
+    pending = [
+        os.path.join(download_folder, name)
+        for name in sorted(os.listdir(download_folder))
+        if fnmatch.fnmatch(name, pattern) and name not in completed
+    ]
+    logger.info(f"처리 대기 중인 파일 {len(pending)}개를 찾았습니다.")
+    return pending
+
+class DownloadEventHandler(FileSystemEventHandler):
+    """
+    다운로드 폴더의 파일 생성/이름 변경 이벤트에서 pattern 과 일치하는 새 파일을 모읍니다.
+    Chrome 은 .crdownload 파일로 받은 뒤 이름을 바꾸므로 이름 변경 이벤트도 확인합니다.
+    """
+
+    def __init__(self, existing_files: Set[str], pattern: str = "*.xlsx"):
+        super().__init__()
+        self.existing_files = existing_files
+        self.pattern = pattern
+        self.candidates: "queue.Queue[str]" = queue.Queue()
+
+    def on_created(self, event) -> None:
+        if not event.is_directory:
+            self.check(event.src_path)
+
+    def on_moved(self, event) -> None:
+        if not event.is_directory:
+            self.check(event.dest_path)
+
+    def check(self, path: str) -> None:
+        name = os.path.basename(path)
+        if fnmatch.fnmatch(name, self.pattern) and name not in self.existing_files:
+            self.candidates.put(path)
+
+def wait_until_stable(
+    path: str, deadline: float, interval: float = DOWNLOAD_STABLE_INTERVAL
+) -> bool:
+    """
+    파일 크기가 더 이상 바뀌지 않고 읽을 수 있을 때까지 대기합니다.
+    """
+    previous_size = -1
+    while time.time() < deadline:
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return False
+        if (
+            size > 0
+            and size == previous_size
+            and not os.path.exists(path + ".crdownload")
+        ):
+            try:
+                with open(path, "rb"):
+                    return True
+            except OSError:
+                pass  # 브라우저가 아직 파일을 쓰는 중
+        previous_size = size
+        time.sleep(interval)
+    return False
+
 def wait_for_download(
-    download_folder: str, existing_files: Set[str], timeout: int = DOWNLOAD_TIMEOUT
+    download_folder: str,
+    existing_files: Set[str],
+    timeout: int = DOWNLOAD_TIMEOUT,
+    requested_at: Optional[float] = None,
+    pattern: str = "*.xlsx",
 ) -> Set[str]:
     """
-    새 파일이 다운로드될 때까지 대기합니다.
-    """
-    start_time = time.time()
-    while True:
-        current_files = set(os.listdir(download_folder))
-        new_files = current_files - existing_files
-        if any(file.endswith(".xlsx") for file in new_files):
-            return new_files
-        if time.time() - start_time > timeout:
-            logger.warning("다운로드 대기 시간 초과")
-            break
-        time.sleep(1)
+    새 파일의 다운로드가 끝날 때까지 파일 시스템 이벤트로 대기합니다.
+    다운로드가 끝난 파일 하나의 이름만 반환합니다.
+    requested_at(다운로드를 요청한 시각, time.time())이 주어지면 그 이후에 쓰인 파일만
+    이번 요청의 다운로드로 인정하고, 그 전에 쓰인 파일이 폴더에 들어온 경우는 무시합니다.
+    """
+    handler = DownloadEventHandler(existing_files, pattern)
+    observer = Observer()
+    observer.schedule(handler, download_folder, recursive=False)
+    observer.start()
+    try:
+        # 감시를 시작하기 전에 이미 받아진 파일 확인
+        for name in set(os.listdir(download_folder)) - existing_files:
+            handler.check(os.path.join(download_folder, name))
+
+        deadline = time.time() + timeout
+        checked: Set[str] = set()
+        while time.time() < deadline:
+            try:
+                path = handler.candidates.get(timeout=max(0, deadline - time.time()))
+            except queue.Empty:
+                break
+            if path in checked:
+                continue
+            checked.add(path)
+
+            if wait_until_stable(path, deadline):
+                if requested_at is not None and os.path.getmtime(path) < requested_at:
+                    logger.info(
+                        f"요청 전에 만들어진 파일이므로 무시합니다: {os.path.basename(path)}"
+                    )
+                    continue
+                logger.info(f"다운로드 완료: {os.path.basename(path)}")
+                return {os.path.basename(path)}
+            checked.discard(path)
+    finally:
+        observer.stop()
+        observer.join()
+
+    logger.warning("다운로드 대기 시간 초과")
     return set()
 
 def rename_downloaded_file(
@@ -61,23 +166,33 @@ def process_file(file_path: str, complete_folder: str, process_func) -> Optional
     """
     try:
         logger.info(f"파일 처리 시작: {file_path}")
-        df = pd.read_excel(file_path, sheet_name="CS Receiving TAT")
+        df = read_excel_cached(
+            file_path,
+            "CS Receiving TAT",
+            loader=read_source_sheet,
+            variant=SOURCE_VARIANT,
+        )
         logger.info("파일 로드 완료: 엑셀 파일을 데이터프레임으로 변환했습니다.")
 
         df = process_func(df)
         logger.info("데이터 프레임 변환 완료: 데이터 전처리를 완료했습니다.")
 
-        new_file_path = os.path.join(complete_folder, os.path.basename(file_path))
-        shutil.move(file_path, new_file_path)
-        logger.info(
-            f"파일 처리 완료: {os.path.basename(file_path)}을(를) 완료 폴더로 이동했습니다."
-        )
-
-        return new_file_path
+        return move_to_complete_folder(file_path, complete_folder)
     except Exception as e:
         logger.error(f"파일 처리 실패: {str(e)}")
         raise
 
+def move_to_complete_folder(file_path: str, complete_folder: str) -> str:
+    """
+    처리가 끝난 파일을 완료 폴더로 이동합니다.
+    """
+    new_file_path = os.path.join(complete_folder, os.path.basename(file_path))
+    shutil.move(file_path, new_file_path)
+    logger.info(
+        f"파일 처리 완료: {os.path.basename(file_path)}을(를) 완료 폴더로 이동했습니다."
+    )
+    return new_file_path
+
 def save_to_excel(df: pd.DataFrame, file_path: str) -> None:
     """
     데이터프레임을 엑셀 파일로 저장합니다.
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Tuple
+
+DAY = np.timedelta64(1, "D")
+
+
+class FiscalCalendar:
+    """
+    Dell 회계 달력(Week/FY/Quarter/Month)을 날짜 컬럼 전체에 대해 배열 연산으로 계산합니다.
+    날짜별 속성은 연도 단위 날짜 차원 테이블로 한 번 만들어 두고 조회합니다.
+    (같은 테이블이 DB 의 DimDate 테이블에 저장됩니다.)
+
+    회계연도 시작일은 해당 연도 2월 1일 이후 첫 토요일이며,
+    1월 날짜는 전년도 시작일을 기준으로 합니다.
+    (2월 1일 ~ 첫 토요일 전 날짜는 WK00 / Q0 으로 계산되는 기존 규칙을 그대로 따릅니다.)
+    """
+
+    def __init__(self):
+        self._fy_starts: Dict[int, np.datetime64] = {}
+        self._dimension: Optional[pd.DataFrame] = None
+        self._dimension_years: Optional[Tuple[int, int]] = None
+
+    def fy_start(self, year: int) -> np.datetime64:
+        """
+        year 년도 회계연도 시작일(2월 1일 이후 첫 토요일)을 반환합니다.
+        """
+        if year not in self._fy_starts:
+            feb_1 = pd.Timestamp(year=year, month=2, day=1)
+            start = feb_1 + pd.Timedelta(days=(5 - feb_1.dayofweek) % 7)
+            self._fy_starts[year] = np.datetime64(start.date(), "D")
+        return self._fy_starts[year]
+
+    def _fy_start_table(self, first_year: int, last_year: int) -> np.ndarray:
+        return np.array(
+            [self.fy_start(year) for year in range(first_year, last_year + 1)],
+            dtype="datetime64[D]",
+        )
+
+    def _derive(self, days: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        datetime64[D] 배열에서 회계 속성을 계산합니다.
+        """
+        years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+        months = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+
+        # 1월은 전년도 회계연도 시작일 기준
+        fy_years = np.where(months >= 2, years, years - 1)
+        first_year = int(fy_years.min())
+        starts = self._fy_start_table(first_year, int(fy_years.max()))
+        fy_start = starts[fy_years - first_year]
+
+        days_since_start = (days - fy_start) // DAY
+        fy_numbers = np.where(days >= fy_start, fy_years + 1, fy_years)
+        week_numbers = days_since_start // 7 + 1
+        quarter_numbers = np.minimum(days_since_start // 91 + 1, 4)
+
+        return {
+            "Week": _format_codes(week_numbers, "WK{:02d}"),
+            "FY": _format_codes(fy_numbers % 100, "FY{:02d}"),
+            "Quarter": _format_codes(quarter_numbers, "Q{}"),
+            "Month": _format_codes(months, "{:02d}"),
+        }
+
+    def date_dimension(self, first_year: int, last_year: int) -> pd.DataFrame:
+        """
+        first_year 1월 1일부터 last_year 12월 31일까지 날짜별 회계 속성 테이블(DimDate)을 만듭니다.
+        """
+        days = np.arange(
+            np.datetime64(f"{first_year}-01-01"),
+            np.datetime64(f"{last_year + 1}-01-01"),
+            dtype="datetime64[D]",
+        )
+        dimension = pd.DataFrame({"Date": days.astype("datetime64[ns]")})
+        for col, values in self._derive(days).items():
+            dimension[col] = values
+        return dimension
+
+    def _lookup_table(self, first_day: np.datetime64, last_day: np.datetime64):
+        """
+        first_day ~ last_day 를 포함하는 날짜 차원 테이블을 반환합니다. (필요할 때만 다시 생성)
+        """
+        first_year = int(first_day.astype("datetime64[Y]").astype(np.int64)) + 1970
+        last_year = int(last_day.astype("datetime64[Y]").astype(np.int64)) + 1970
+        if self._dimension is not None:
+            first_year = min(first_year, self._dimension_years[0])
+            last_year = max(last_year, self._dimension_years[1])
+        if self._dimension_years != (first_year, last_year):
+            self._dimension = self.date_dimension(first_year, last_year)
+            self._dimension_years = (first_year, last_year)
+        return self._dimension
+
+    def compute(self, dates: pd.Series) -> pd.DataFrame:
+        """
+        날짜 컬럼의 Week, FY, Quarter, Month 를 날짜 차원 테이블에서 찾아 반환합니다.
+        날짜가 없는 행은 "Unknown" (Month 는 "00") 입니다.
+        """
+        dates = pd.to_datetime(dates)
+        valid = dates.notna().to_numpy()
+        days = dates.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+
+        columns = {
+            "Week": np.full(len(dates), "Unknown", dtype=object),
+            "FY": np.full(len(dates), "Unknown", dtype=object),
+            "Quarter": np.full(len(dates), "Unknown", dtype=object),
+            "Month": np.full(len(dates), "00", dtype=object),
+        }
+
+        if valid.any():
+            valid_days = days[valid]
+            dimension = self._lookup_table(valid_days.min(), valid_days.max())
+            first_day = dimension["Date"].iloc[0].to_datetime64().astype("datetime64[D]")
+            positions = (valid_days - first_day) // DAY
+            for col, values in columns.items():
+                values[valid] = dimension[col].to_numpy()[positions]
+
+        return pd.DataFrame(columns, index=dates.index)
+
+
+def _format_codes(numbers: np.ndarray, fmt: str) -> np.ndarray:
+    """
+    정수 배열을 문자열 코드로 바꿉니다. (고유값만 포맷)
+    """
+    uniques, inverse = np.unique(numbers, return_inverse=True)
+    labels = np.array([fmt.format(int(n)) for n in uniques], dtype=object)
+    return labels[inverse]
@@ -0,0 +1,185 @@
+import os
+import json
+import logging
+from typing import Dict, Any, List, Optional, Set
+
+import pandas as pd
+from config import INCREMENTAL_STATE_FILE, INCREMENTAL_LOOKBACK_DAYS
+
+logger = logging.getLogger(__name__)
+
+# 원본 데이터에서 행을 식별하는 업무 키
+KEY_COLUMN = "Cust Sys No"
+
+
+def _row_dates(df: pd.DataFrame) -> pd.Series:
+    """
+    행의 기준 날짜(PutAwayDate, 없으면 ActualPhysicalReceiptDate)를 반환합니다.
+    """
+    dates = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    for col in ["ActualPhysicalReceiptDate", "PutAwayDate"]:
+        if col in df.columns:
+            values = pd.to_datetime(df[col], errors="coerce")
+            dates = values.where(values.notna(), dates)
+    return dates
+
+
+def row_fingerprints(df: pd.DataFrame) -> pd.Series:
+    """
+    원본 행 내용의 64비트 해시를 계산합니다. (같은 내용이면 실행마다 같은 값)
+    """
+    return pd.util.hash_pandas_object(df, index=False)
+
+
+def key_fingerprints(df: pd.DataFrame) -> pd.Series:
+    """
+    Cust Sys No 별로 원본 행 해시를 더한 64비트 값을 반환합니다. (키가 없는 행은 제외)
+    더하기(2^64 나머지)이므로 행 순서와 청크 분할에 관계없이 같고, 청크별 값을 더해도 같습니다.
+    """
+    keyed = df[df[KEY_COLUMN].notna()]
+    return (
+        row_fingerprints(keyed).groupby(keyed[KEY_COLUMN].astype(str).to_numpy()).sum()
+    )
+
+
+class IncrementalLoadState:
+    """
+    누적 리포트처럼 매번 전체 이력이 들어오는 파일에서 새로 추가/변경된 Cust Sys No 의 행만 골라냅니다.
+
+    소스별로 키마다 원본 행 해시의 합(key_fingerprints)을 저장하고,
+    저장된 값이 없거나 달라진 키의 행을 모두 고릅니다. (키의 행 전체가 다시 처리되므로
+    업로드는 기존 값에 더하지 않고 교체해야 함: upload_to_mysql(accumulate=False))
+    날짜로 행을 건너뛰지 않으며, 기준 시점(high-water mark) - lookback_days 보다
+    오래된 키가 추가/변경되면 소급 입력으로 보고 경고 로그를 남깁니다.
+
+    파일 전체는 filter_new_rows 에 한 번 넘기고, 청크로 읽을 때는 모든 청크를 observe 한 뒤
+    select_rows 로 청크마다 고릅니다.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        state_file: str = INCREMENTAL_STATE_FILE,
+        lookback_days: int = INCREMENTAL_LOOKBACK_DAYS,
+    ):
+        self.source = source
+        self.state_file = state_file
+        self.lookback = pd.Timedelta(days=lookback_days)
+        self.state = self._load().get(source, {})
+        self._observed: List[pd.Series] = []
+        self._observed_dates: List[pd.Series] = []
+        self._selected: Optional[Set[str]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @property
+    def high_water_mark(self) -> Optional[pd.Timestamp]:
+        value = self.state.get("high_water_mark")
+        return pd.Timestamp(value) if value else None
+
+    @property
+    def input_unique_count(self) -> int:
+        """
+        지금까지 observe 한 원본의 유니크 Cust Sys No 수입니다. (필터 전)
+        """
+        return len(self._combined()[0])
+
+    def observe(self, df: pd.DataFrame) -> None:
+        """
+        원본 행(또는 청크)의 키별 해시와 최대 날짜를 모읍니다.
+        """
+        if self._selected is not None:
+            raise RuntimeError("select_rows 이후에는 observe 할 수 없습니다.")
+        keyed = df[df[KEY_COLUMN].notna()]
+        keys = keyed[KEY_COLUMN].astype(str).to_numpy()
+        self._observed.append(key_fingerprints(keyed))
+        self._observed_dates.append(_row_dates(keyed).groupby(keys).max())
+
+    def _combined(self):
+        """
+        observe 한 청크별 값을 키별로 합쳐 (키별 해시, 키별 최대 날짜) 를 반환합니다.
+        """
+        if len(self._observed) != 1:
+            fingerprints = pd.concat([pd.Series(dtype="uint64")] + self._observed)
+            dates = pd.concat(
+                [pd.Series(dtype="datetime64[ns]")] + self._observed_dates
+            )
+            self._observed = [fingerprints.groupby(level=0).sum()]
+            self._observed_dates = [dates.groupby(level=0).max()]
+        return self._observed[0], self._observed_dates[0]
+
+    def _select_keys(self) -> Set[str]:
+        if self._selected is not None:
+            return self._selected
+
+        fingerprints, dates = self._combined()
+        stored = self.state.get("keys", {})
+        current = fingerprints.astype(str)
+        previous = pd.Series(stored, dtype=object).reindex(current.index)
+        new = previous.isna()
+        changed = ~new & (previous != current)
+        selected = new | changed
+        self._selected = set(current.index[selected])
+
+        hwm = self.high_water_mark
+        late = 0
+        if hwm is not None:
+            late = int((selected & (dates < hwm - self.lookback)).sum())
+        logger.info(
+            f"증분 적재: 유니크 키 {len(current)}개 중 새 키 {int(new.sum())}개, "
+            f"변경된 키 {int(changed.sum())}개 (기준 시점: {hwm})"
+        )
+        if late:
+            logger.warning(
+                f"증분 적재: 기준 시점 {hwm} - {self.lookback.days}일 보다 오래된 "
+                f"키 {late}개가 추가/변경되어 함께 적재합니다. (소급 입력)"
+            )
+        return self._selected
+
+    def select_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        observe 한 원본 전체 기준으로 새로 추가되거나 바뀐 키의 행만 반환합니다.
+        """
+        selected = self._select_keys()
+        return df[df[KEY_COLUMN].astype(str).isin(selected)]
+
+    def filter_new_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        파일 전체에서 이전 적재 이후 새로 추가되거나 바뀐 키의 행만 반환합니다.
+        """
+        self.observe(df)
+        result = self.select_rows(df)
+        logger.info(f"증분 적재: 전체 {len(df)} 행 중 대상 {len(result)} 행")
+        return result
+
+    def commit(self) -> None:
+        """
+        고른 행이 업로드된 뒤 호출하여 이번 원본의 키별 해시를 저장합니다.
+        (원본에 없는 키는 상태에서 빠지며, 다시 나타나면 새 키로 교체 업로드됨)
+        """
+        if self._selected is None:
+            return
+
+        fingerprints, dates = self._combined()
+        hwm = self.high_water_mark
+        new_max = dates.max()
+        if pd.notna(new_max) and (hwm is None or new_max > hwm):
+            hwm = new_max
+
+        self.state = {
+            "high_water_mark": hwm.isoformat() if hwm is not None else None,
+            "keys": fingerprints.astype(str).to_dict(),
+        }
+        all_states = self._load()
+        all_states[self.source] = self.state
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+        tmp_path = f"{self.state_file}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(all_states, f)
+        os.replace(tmp_path, self.state_file)
+        self._selected = None
+        logger.info(f"증분 적재 상태 저장: {self.source} (기준 시점: {hwm})")
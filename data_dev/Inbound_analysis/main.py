@@ -1,7 +1,7 @@
 import os
 import logging
-from typing import Dict, Any
-import warnings
+import unicodedata
+from typing import Dict, Any, Optional, Tuple
 import pandas as pd
 from config import (
     DOWNLOAD_FOLDER,
@@ -9,9 +9,28 @@ from config import (
     DB_CONFIG,
     COLUMN_MAPPING,
     ORDER_TYPE_MAPPING,
+    INCREMENTAL_LOAD,
+    PROCESSING_MODE,
+    PROCESSING_WORKERS,
+    PROCESSING_ENGINE,
+    COUNTRY_MODE,
+    UPLOAD_WORKERS,
 )
-from database import create_tables, upload_to_mysql
-from data_processor import main_data_processing
+from database import (
+    create_tables,
+    upload_to_mysql,
+    upload_country_partitions,
+    get_pool_stats,
+)
+from data_processor import (
+    main_data_processing,
+    main_data_processing_by_country,
+    main_data_processing_chunked,
+    main_data_processing_parallel,
+)
+from excel_cache import read_excel_cached, get_content_hash
+from excel_reader import read_source_sheet, iter_source_chunks, SOURCE_VARIANT
+from incremental import IncrementalLoadState
 
 # 로깅 설정
 logging.basicConfig(
@@ -33,6 +52,12 @@ def setup_config() -> Dict[str, Any]:
         "DB_CONFIG": DB_CONFIG,
         "COLUMN_MAPPING": COLUMN_MAPPING,
         "ORDER_TYPE_MAPPING": ORDER_TYPE_MAPPING,
+        "INCREMENTAL_LOAD": INCREMENTAL_LOAD,
+        "PROCESSING_MODE": PROCESSING_MODE,
+        "PROCESSING_WORKERS": PROCESSING_WORKERS,
+        "PROCESSING_ENGINE": PROCESSING_ENGINE,
+        "COUNTRY_MODE": COUNTRY_MODE,
+        "UPLOAD_WORKERS": UPLOAD_WORKERS,
     }
 
 
@@ -46,12 +71,13 @@ def get_user_input() -> str:
 def read_excel(filepath: str, sheet_name: str) -> pd.DataFrame:
     """
     엑셀 파일을 읽어 데이터프레임으로 반환합니다.
+    헤더 행으로 필요한 컬럼('Cust Sys No' 별칭 포함)만 골라 dtype 을 지정해 읽습니다.
     """
     try:
         print(f"엑셀 파일 '{filepath}' 읽기 시작")
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
-            df = pd.read_excel(filepath, sheet_name=sheet_name)
+        df = read_excel_cached(
+            filepath, sheet_name, loader=read_source_sheet, variant=SOURCE_VARIANT
+        )
         print(f"엑셀 파일에서 {len(df)} 행의 데이터를 읽었습니다.")
         return df
     except Exception as e:
@@ -59,44 +85,210 @@ def read_excel(filepath: str, sheet_name: str) -> pd.DataFrame:
         raise
 
 
+def process_in_chunks(
+    file_path: str,
+    config: Dict[str, Any],
+    incremental_state: Optional[IncrementalLoadState] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    엑셀 파일을 EXCEL_CHUNK_SIZE 행씩 읽으며 처리합니다.
+    (원본 전체를 메모리에 올리지 않고 Cust_Sys_No 별 부분 집계만 유지)
+    증분 적재면 파일을 두 번 읽습니다. (키별 해시를 모두 본 뒤 바뀐 키의 행만 처리)
+    """
+    print("\n엑셀 파일을 청크 단위로 읽으며 데이터 처리 중...")
+    chunks = iter_source_chunks(file_path, "CS Receiving TAT")
+    if incremental_state:
+        for chunk in chunks:
+            incremental_state.observe(chunk)
+        chunks = (
+            incremental_state.select_rows(chunk)
+            for chunk in iter_source_chunks(file_path, "CS Receiving TAT")
+        )
+    processed_df, stats = main_data_processing_chunked(chunks, config)
+    if incremental_state:
+        _apply_source_count(stats, incremental_state.input_unique_count)
+    print(f"{stats['chunk_count']}개 청크 처리 완료")
+    return processed_df, stats
+
+
+def _apply_source_count(stats: Dict[str, Any], original_unique_count: int):
+    """
+    증분 적재에서 처리 통계의 원본 유니크 수를 필터 전 원본 기준으로 바꿉니다.
+    (필터 후 유니크 수는 target_unique_count, 일치율은 필터 후 기준 그대로)
+    """
+    stats["target_unique_count"] = stats["original_unique_count"]
+    stats["original_unique_count"] = original_unique_count
+
+
+# 국가별 통계 표의 컬럼 너비 (헤더와 값 행에 같이 사용, 첫 컬럼만 왼쪽 정렬)
+COUNTRY_STATS_WIDTHS = [6, 14, 16, 10, 9, 9, 9]
+
+
+def _display_width(text: str) -> int:
+    """
+    터미널에 표시되는 너비를 반환합니다. (한글 등 전각 문자는 2칸)
+    """
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+
+def _format_row(values: list) -> str:
+    cells = []
+    for i, (value, width) in enumerate(zip(values, COUNTRY_STATS_WIDTHS)):
+        text = str(value)
+        padding = " " * max(0, width - _display_width(text))
+        cells.append(text + padding if i == 0 else padding + text)
+    return "".join(cells)
+
+
+def print_country_stats(
+    country_stats: Dict[str, Dict[str, Any]], uploaded: Dict[str, Dict[str, int]]
+):
+    """
+    국가별 처리 통계를 나란히 출력합니다.
+    """
+    line = "=" * sum(COUNTRY_STATS_WIDTHS)
+    print(f"\n{line}")
+    print("국가별 데이터 처리 통계:")
+    print(line)
+    print(
+        _format_row(
+            ["국가", "원본 유니크", "처리된 유니크", "일치율", "새 행", "변경", "건너뜀"]
+        )
+    )
+    for country, stats in country_stats.items():
+        summary = uploaded.get(country, {})
+        print(
+            _format_row(
+                [
+                    country,
+                    stats["original_unique_count"],
+                    stats["processed_unique_count"],
+                    f"{stats['match_rate']:.2f}%",
+                    summary.get("inserted", 0),
+                    summary.get("updated", 0),
+                    summary.get("skipped", 0),
+                ]
+            )
+        )
+    print(line)
+
+
+def process_and_upload_all_countries(
+    file_path: str,
+    config: Dict[str, Any],
+    incremental_state: Optional[IncrementalLoadState] = None,
+):
+    """
+    모든 국가를 한 번에 처리하여 국가별 테이블에 동시에 업로드합니다.
+    (PROCESSING_MODE 와 관계없이 파일 전체를 한 번 읽어 처리)
+    """
+    df = read_excel(file_path, "CS Receiving TAT")
+    print(f"\n원본 데이터 행 수: {len(df)}")
+
+    if incremental_state:
+        source_counts = df.groupby("Country")["Cust Sys No"].nunique()
+        df = incremental_state.filter_new_rows(df)
+        print(f"증분 적재 대상 행 수: {len(df)}")
+        if df.empty:
+            print("새로 추가되거나 변경된 데이터가 없습니다.")
+            return
+
+    print("\n모든 국가 데이터 처리 중...")
+    partitions, country_stats = main_data_processing_by_country(df, config)
+    if incremental_state:
+        for country, stats in country_stats.items():
+            _apply_source_count(stats, int(source_counts[country]))
+    print(f"처리된 국가: {', '.join(partitions)}")
+
+    print("\n국가별 테이블에 동시 업로드 중...")
+    uploaded = upload_country_partitions(
+        partitions,
+        config.get("UPLOAD_WORKERS"),
+        source_hash=get_content_hash(file_path),
+        source_name=os.path.basename(file_path),
+        accumulate=incremental_state is None,
+    )
+    print("데이터베이스 업로드 완료")
+
+    if incremental_state:
+        incremental_state.commit()
+
+    print_country_stats(country_stats, uploaded)
+
+
 def process_and_upload_data(file_path: str, config: Dict[str, Any]):
     try:
         print(f"\n{'='*50}")
         print(f"파일 '{os.path.basename(file_path)}' 처리 시작")
         print(f"{'='*50}")
 
-        df = read_excel(file_path, "CS Receiving TAT")
-        print(f"\n원본 데이터 행 수: {len(df)}")
-        print(f"원본 데이터 열: {', '.join(df.columns.tolist())}")
-
-        # 컬럼 이름 확인 및 수정
-        if "Cust Sys No" not in df.columns:
-            possible_names = [
-                "Customer System Number",
-                "Customer Sys No",
-                "Cust System No",
-            ]
-            for name in possible_names:
-                if name in df.columns:
-                    df = df.rename(columns={name: "Cust Sys No"})
-                    break
-            else:
-                raise ValueError("'Cust Sys No' 또는 유사한 컬럼을 찾을 수 없습니다.")
+        incremental_state = None
+        if config.get("INCREMENTAL_LOAD"):
+            incremental_state = IncrementalLoadState(os.path.basename(file_path))
 
-        print("\n데이터 처리 중...")
-        processed_df, stats = main_data_processing(df, config)
+        if config.get("COUNTRY_MODE") == "all":
+            process_and_upload_all_countries(file_path, config, incremental_state)
+            return
+
+        if config.get("PROCESSING_MODE") == "chunked":
+            processed_df, stats = process_in_chunks(
+                file_path, config, incremental_state
+            )
+            if processed_df.empty:
+                if incremental_state:
+                    print("새로 추가되거나 변경된 데이터가 없습니다.")
+                else:
+                    print("처리된 데이터가 없습니다.")
+                    logger.warning(
+                        f"원본에서 처리된 행이 없습니다: {os.path.basename(file_path)}"
+                    )
+                return
+        else:
+            df = read_excel(file_path, "CS Receiving TAT")
+            print(f"\n원본 데이터 행 수: {len(df)}")
+            print(f"원본 데이터 열: {', '.join(df.columns.tolist())}")
+
+            if incremental_state:
+                original_unique_count = df["Cust Sys No"].nunique()
+                df = incremental_state.filter_new_rows(df)
+                print(f"증분 적재 대상 행 수: {len(df)}")
+                if df.empty:
+                    print("새로 추가되거나 변경된 데이터가 없습니다.")
+                    return
+
+            print("\n데이터 처리 중...")
+            if config.get("PROCESSING_MODE") == "parallel":
+                processed_df, stats = main_data_processing_parallel(df, config)
+            else:
+                processed_df, stats = main_data_processing(df, config)
+            if incremental_state:
+                _apply_source_count(stats, original_unique_count)
 
         print(f"\n처리된 데이터 행 수: {len(processed_df)}")
         print(f"처리된 데이터 열: {', '.join(processed_df.columns.tolist())}")
 
         print("\n데이터베이스에 업로드 중...")
-        upload_to_mysql(processed_df)
-        print("데이터베이스 업로드 완료")
+        # 증분 적재는 바뀐 키의 전체 값을 다시 보내므로 기존 값에 더하지 않고 교체
+        summary = upload_to_mysql(
+            processed_df,
+            source_hash=get_content_hash(file_path),
+            source_name=os.path.basename(file_path),
+            accumulate=incremental_state is None,
+        )
+        print(
+            f"데이터베이스 업로드 완료 (새 행 {summary['inserted']}, "
+            f"변경 {summary['updated']}, 건너뜀 {summary['skipped']})"
+        )
+
+        if incremental_state:
+            incremental_state.commit()
 
         print(f"\n{'='*50}")
         print("데이터 처리 통계:")
         print(f"{'='*50}")
         print(f"원본 유니크 레코드 수: {stats['original_unique_count']}")
+        if "target_unique_count" in stats:
+            print(f"증분 적재 대상 유니크 레코드 수: {stats['target_unique_count']}")
         print(f"처리된 유니크 레코드 수: {stats['processed_unique_count']}")
         print(f"일치율: {stats['match_rate']:.2f}%")
         print(f"{'='*50}")
@@ -126,6 +318,7 @@ def main():
             process_and_upload_data(file_path, config)
 
             print("\n처리 완료!")
+            logger.info(f"DB 연결 풀 통계: {get_pool_stats()}")
         else:
             print(f"\n오류: 파일을 찾을 수 없습니다 - {file_path}")
 
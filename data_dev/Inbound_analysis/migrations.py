@@ -0,0 +1,269 @@
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import mysql.connector
+from config import (
+    ORDER_TYPE_TABLE,
+    DIM_DATE_TABLE,
+    DIM_DATE_START_YEAR,
+    DIM_DATE_END_YEAR,
+    LOAD_LEDGER_TABLE,
+    LOAD_LEDGER_ROWS_TABLE,
+    SCHEMA_VERSION_TABLE,
+)
+from fiscal_calendar import FiscalCalendar
+from schema import RECEIVING_TAT_SCHEMA, ROW_HASH_COLUMN, create_table_sql
+
+logger = logging.getLogger(__name__)
+
+# 버전 테이블이 아직 없을 때의 오류 코드 (1146: 테이블 없음)
+NO_SUCH_TABLE_ERROR = 1146
+
+# 공용 테이블(OrderType, DimDate, 적재 원장) 마이그레이션의 범위 이름
+CORE_SCOPE: str = "core"
+
+# Receiving_TAT_Report(국가별 테이블 포함) 조회 경로별 보조 인덱스 (인덱스 이름 -> 컬럼)
+# idx_inventory_date: get_data_by_inventory_date 의 InventoryDate BETWEEN 조회와
+#   get_data_by_fy_and_quarter 의 DimDate 조인 (d.Date = r.InventoryDate)
+# idx_putaway_date: get_data_by_date 의 PutAwayDate BETWEEN 조회
+REPORT_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "idx_inventory_date": ("InventoryDate",),
+    "idx_putaway_date": ("PutAwayDate",),
+}
+
+
+class Migration:
+    """
+    스키마 변경 한 단계입니다.
+    apply(conn, table_name) 은 이미 일부가 적용된 테이블에서 다시 실행해도 안전해야 합니다.
+    (버전 기록 전에 중단되면 다음 실행에서 같은 단계를 다시 적용)
+    """
+
+    def __init__(self, version: int, description: str, apply: Callable[..., None]):
+        self.version = version
+        self.description = description
+        self.apply = apply
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version}, {self.description})"
+
+
+def _create_core_tables(conn, table_name: str):
+    conn.execute_query(
+        f"""
+        CREATE TABLE IF NOT EXISTS {ORDER_TYPE_TABLE} (
+            EDI_Order_Type VARCHAR(255) PRIMARY KEY,
+            Detailed_Order_Type VARCHAR(255)
+        )
+        """
+    )
+    conn.execute_query(
+        f"""
+        CREATE TABLE IF NOT EXISTS {DIM_DATE_TABLE} (
+            Date DATE PRIMARY KEY,
+            FY VARCHAR(20),
+            Quarter VARCHAR(10),
+            Month VARCHAR(2),
+            Week VARCHAR(10),
+            INDEX idx_dimdate_fy_quarter (FY, Quarter)
+        )
+        """
+    )
+    conn.execute_query(
+        f"""
+        CREATE TABLE IF NOT EXISTS {LOAD_LEDGER_TABLE} (
+            Source_Hash CHAR(64),
+            Table_Name VARCHAR(64),
+            Source_Name VARCHAR(255),
+            Row_Count INT,
+            Completed TINYINT(1) NOT NULL DEFAULT 0,
+            Started_At DATETIME,
+            Completed_At DATETIME,
+            PRIMARY KEY (Source_Hash, Table_Name)
+        )
+        """
+    )
+    conn.execute_query(
+        f"""
+        CREATE TABLE IF NOT EXISTS {LOAD_LEDGER_ROWS_TABLE} (
+            Source_Hash CHAR(64),
+            Table_Name VARCHAR(64),
+            Cust_Sys_No VARCHAR(255),
+            PRIMARY KEY (Source_Hash, Table_Name, Cust_Sys_No)
+        )
+        """
+    )
+
+
+def _populate_dim_date(conn, table_name: str):
+    """
+    DimDate 테이블을 DIM_DATE_START_YEAR ~ DIM_DATE_END_YEAR 의 Dell 회계 속성으로 채웁니다.
+    """
+    dimension = FiscalCalendar().date_dimension(DIM_DATE_START_YEAR, DIM_DATE_END_YEAR)
+    query = f"""
+    INSERT INTO {DIM_DATE_TABLE} (Date, FY, Quarter, Month, Week)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE FY=VALUES(FY), Quarter=VALUES(Quarter),
+        Month=VALUES(Month), Week=VALUES(Week)
+    """
+    rows = list(
+        zip(
+            dimension["Date"].dt.date,
+            dimension["FY"],
+            dimension["Quarter"],
+            dimension["Month"],
+            dimension["Week"],
+        )
+    )
+    conn.executemany(query, rows)
+    logger.info(f"{len(rows)} rows written to {DIM_DATE_TABLE}")
+
+
+def _create_report_table(conn, table_name: str):
+    conn.execute_query(
+        create_table_sql(
+            table_name,
+            RECEIVING_TAT_SCHEMA,
+            constraints=[
+                f"FOREIGN KEY (EDI_Order_Type) REFERENCES {ORDER_TYPE_TABLE}(EDI_Order_Type)"
+            ],
+        )
+    )
+
+
+def _add_row_hash_column(conn, table_name: str):
+    """
+    Row_Hash 컬럼이 생기기 전에 만든 테이블에 컬럼을 추가합니다.
+    """
+    conn.execute_query(
+        """
+        SELECT COUNT(*) FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s
+        """,
+        (table_name, ROW_HASH_COLUMN),
+    )
+    (exists,) = conn.cursor.fetchone()
+    if not exists:
+        conn.execute_query(
+            f"ALTER TABLE {table_name} ADD COLUMN {ROW_HASH_COLUMN} BIGINT UNSIGNED"
+        )
+
+
+def _add_report_indexes(conn, table_name: str):
+    """
+    없는 보조 인덱스만 ALTER TABLE 한 번으로 추가합니다. (테이블 재구성 1회)
+    """
+    conn.execute_query(
+        """
+        SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """,
+        (table_name,),
+    )
+    existing = {name for (name,) in conn.cursor.fetchall()}
+    additions = [
+        f"ADD INDEX {name} ({', '.join(columns)})"
+        for name, columns in REPORT_INDEXES.items()
+        if name not in existing
+    ]
+    if additions:
+        conn.execute_query(f"ALTER TABLE {table_name} {', '.join(additions)}")
+
+
+# 버전 순서대로 적용하는 마이그레이션 (이미 배포된 단계는 수정하지 말고 새 버전을 추가)
+# DIM_DATE_START_YEAR/END_YEAR 를 바꾸면 _populate_dim_date 를 새 버전으로 다시 추가
+CORE_MIGRATIONS: List[Migration] = [
+    Migration(1, "OrderType, DimDate, 적재 원장 테이블 생성", _create_core_tables),
+    Migration(2, "DimDate 채우기", _populate_dim_date),
+]
+
+REPORT_MIGRATIONS: List[Migration] = [
+    Migration(1, "Receiving_TAT_Report 테이블 생성", _create_report_table),
+    Migration(2, "Row_Hash 컬럼 추가", _add_row_hash_column),
+    Migration(3, "조회 경로별 보조 인덱스 추가", _add_report_indexes),
+]
+
+
+def get_schema_versions(conn) -> Dict[str, int]:
+    """
+    범위(core 또는 테이블 이름)별로 적용된 마지막 마이그레이션 버전을 한 번에 조회합니다.
+    (버전 테이블이 없으면 빈 dict)
+    """
+    try:
+        conn.cursor.execute(
+            f"SELECT Scope, MAX(Version) FROM {SCHEMA_VERSION_TABLE} GROUP BY Scope"
+        )
+    except mysql.connector.Error as err:
+        if err.errno != NO_SUCH_TABLE_ERROR:
+            raise
+        return {}
+    return {scope: version for scope, version in conn.cursor.fetchall()}
+
+
+def _create_version_table(conn):
+    conn.execute_query(
+        f"""
+        CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+            Scope VARCHAR(64),
+            Version INT,
+            Description VARCHAR(255),
+            Applied_At DATETIME,
+            PRIMARY KEY (Scope, Version)
+        )
+        """
+    )
+
+
+def _apply_pending(
+    conn,
+    scope: str,
+    migrations: Sequence[Migration],
+    current: int,
+    table_name: str,
+) -> int:
+    """
+    current 보다 높은 버전의 마이그레이션을 순서대로 적용하고 단계마다 버전을 기록합니다.
+    적용한 단계 수를 반환합니다.
+    """
+    pending = [m for m in migrations if m.version > current]
+    for migration in pending:
+        logger.info(
+            f"{scope} 마이그레이션 {migration.version} 적용 중: {migration.description}"
+        )
+        migration.apply(conn, table_name)
+        conn.execute_query(
+            f"""
+            INSERT IGNORE INTO {SCHEMA_VERSION_TABLE}
+                (Scope, Version, Description, Applied_At)
+            VALUES (%s, %s, %s, %s)
+            """,
+            (scope, migration.version, migration.description, datetime.now()),
+        )
+    return len(pending)
+
+
+def run_migrations(conn, report_tables: Sequence[str]) -> int:
+    """
+    공용 테이블과 report_tables 의 스키마를 최신 버전으로 맞추고 적용한 단계 수를 반환합니다.
+    모두 최신이면 버전 조회 한 번 외에는 DDL 을 실행하지 않습니다.
+    """
+    versions = get_schema_versions(conn)
+    targets = [(CORE_SCOPE, CORE_MIGRATIONS, "")] + [
+        (table_name, REPORT_MIGRATIONS, table_name) for table_name in report_tables
+    ]
+    if all(
+        versions.get(scope, 0) >= migrations[-1].version
+        for scope, migrations, _ in targets
+    ):
+        logger.info("스키마가 최신 버전입니다.")
+        return 0
+
+    _create_version_table(conn)
+    applied = 0
+    for scope, migrations, table_name in targets:
+        applied += _apply_pending(
+            conn, scope, migrations, versions.get(scope, 0), table_name
+        )
+    logger.info(f"마이그레이션 {applied}단계 적용 완료")
+    return applied
@@ -0,0 +1,228 @@
+import logging
+import time
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+import polars as pl
+from data_processor import DataProcessor, _log_stats
+from fiscal_calendar import FiscalCalendar
+from schema import CATEGORICAL_COLUMNS, enforce_schema
+
+logger = logging.getLogger(__name__)
+
+DATE_COLUMNS: List[str] = ["PutAwayDate", "ActualPhysicalReceiptDate"]
+FISCAL_COLUMNS: List[str] = ["Week", "FY", "Quarter", "Month"]
+
+
+def _prepare_source(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    pandas 엔진과 같은 규칙(errors="coerce")으로 숫자/날짜 컬럼을 맞춘 뒤 polars 로 넘깁니다.
+    (엑셀 리더가 이미 dtype 을 맞춘 경우에는 아무것도 하지 않음)
+    """
+    converted = {}
+    if "Quantity" in df.columns and not pd.api.types.is_numeric_dtype(df["Quantity"]):
+        converted["Quantity"] = pd.to_numeric(df["Quantity"], errors="coerce")
+    for col in DATE_COLUMNS:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            converted[col] = pd.to_datetime(df[col], errors="coerce")
+    return df.assign(**converted) if converted else df
+
+
+def _year_range(source: pl.DataFrame) -> Tuple[int, int]:
+    """
+    날짜 차원 테이블을 만들 연도 범위를 원본 날짜 컬럼에서 구합니다.
+    """
+    years = [
+        year
+        for col in DATE_COLUMNS
+        if col in source.columns
+        for year in (source[col].dt.year().min(), source[col].dt.year().max())
+        if year is not None
+    ]
+    return (min(years), max(years)) if years else (2000, 2000)
+
+
+def _fiscal_dimension(first_year: int, last_year: int) -> pl.LazyFrame:
+    dimension = FiscalCalendar().date_dimension(first_year, last_year)
+    return (
+        pl.from_pandas(dimension)
+        .with_columns(pl.col("Date").cast(pl.Date).alias("__date"))
+        .drop("Date")
+        .lazy()
+    )
+
+
+def build_plan(
+    source: pl.DataFrame, config: Dict[str, Any]
+) -> Tuple[pl.LazyFrame, pl.LazyFrame, pl.LazyFrame, List[str]]:
+    """
+    DataProcessor 단계와 같은 변환을 polars lazy plan 으로 만듭니다.
+    (KR 필터 직후 프레임, 집계 전 프레임, Cust_Sys_No 별 집계 결과,
+    집계 결과의 컬럼 순서를 반환)
+    집계 결과의 나머지 컬럼에는 값 대신 값이 있는 첫 행의 위치(__row)가 들어갑니다.
+    """
+    mapping = {
+        src: dst
+        for src, dst in config["COLUMN_MAPPING"].items()
+        if src in source.columns and src != dst
+    }
+    columns = [mapping.get(col, col) for col in source.columns]
+    lf = source.lazy().rename(mapping)
+
+    if "Country" in columns:
+        lf = lf.filter(pl.col("Country") == "KR")
+    filtered = lf
+
+    if "Quantity" in columns:
+        lf = lf.with_columns(
+            pl.col("Quantity").cast(pl.Float64).fill_nan(0).fill_null(0).cast(pl.Int64)
+        )
+
+    # PutAwayDate가 없는 경우 ActualPhysicalReceiptDate로 대체
+    if "PutAwayDate" in columns and "ActualPhysicalReceiptDate" in columns:
+        lf = lf.with_columns(
+            pl.coalesce("PutAwayDate", "ActualPhysicalReceiptDate").alias("PutAwayDate")
+        )
+    if "PutAwayDate" in columns:
+        lf = lf.with_columns(
+            pl.col("PutAwayDate").dt.truncate("1d").alias("InventoryDate")
+        )
+        columns.append("InventoryDate")
+    if "ActualPhysicalReceiptDate" in columns:
+        lf = lf.drop("ActualPhysicalReceiptDate")
+        columns.remove("ActualPhysicalReceiptDate")
+
+    if "Replen_Balance_Order" in columns:
+        lf = lf.with_columns(
+            pl.col("Replen_Balance_Order")
+            .cast(pl.Utf8)
+            .str.split(".")
+            .list.first()
+            .cast(pl.Int64, strict=False)
+        )
+
+    # ShipFromCode의 값이 REMARK라면 none으로 처리
+    if "ShipFromCode" in columns:
+        lf = lf.with_columns(
+            pl.when(pl.col("ShipFromCode").str.to_uppercase() == "REMARK")
+            .then(None)
+            .otherwise(pl.col("ShipFromCode"))
+            .alias("ShipFromCode")
+        )
+
+    if "PutAwayDate" in columns:
+        lf = (
+            lf.with_columns(pl.col("InventoryDate").cast(pl.Date).alias("__date"))
+            .join(_fiscal_dimension(*_year_range(source)), on="__date", how="left")
+            .drop("__date")
+            .with_columns(
+                pl.col("Week").fill_null("Unknown"),
+                pl.col("FY").fill_null("Unknown"),
+                pl.col("Quarter").fill_null("Unknown"),
+                pl.col("Month").fill_null("00"),
+            )
+        )
+        columns.extend(FISCAL_COLUMNS)
+
+    lf = lf.with_columns(
+        pl.col("EDI_Order_Type")
+        .replace(config["ORDER_TYPE_MAPPING"], default="Unknown")
+        .alias("OrderType")
+    )
+    columns.append("OrderType")
+
+    # 모든 컬럼은 값이 있는 첫 행의 위치, Count_PO는 행 수, Quantity는 합계
+    # (drop_nulls().first() 는 그룹별로 느린 경로를 타므로 위치만 구해 나중에 gather)
+    lf = lf.with_row_index("__row")
+    first_columns = [c for c in columns if c not in ("Cust_Sys_No", "Quantity")]
+    aggregated = lf.group_by("Cust_Sys_No").agg(
+        [
+            pl.col("__row").filter(pl.col(c).is_not_null()).min().alias(c)
+            for c in first_columns
+        ]
+        + [pl.len().cast(pl.Int64).alias("Count_PO"), pl.col("Quantity").sum()]
+    )
+    output_columns = ["Cust_Sys_No"] + first_columns + ["Count_PO", "Quantity"]
+    return filtered, lf, aggregated, output_columns
+
+
+def _unique_values(columns: List[str]) -> List[pl.Expr]:
+    return [pl.col(c).drop_nulls().unique().implode() for c in columns]
+
+
+def main_data_processing_polars(
+    df: pd.DataFrame, config: Dict[str, Any]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    main_data_processing 과 같은 결과(데이터프레임, 통계)를 polars 컬럼 연산으로 계산합니다.
+    변환과 집계는 하나의 lazy plan 으로 멀티스레드 실행하고,
+    집계된 결과에만 pandas 쪽 결측값 처리와 스키마 dtype 을 적용합니다.
+    """
+    start = time.perf_counter()
+    source = pl.from_pandas(_prepare_source(df))
+    filtered, prepared, aggregated, output_columns = build_plan(source, config)
+
+    # category 컬럼의 카테고리도 pandas 엔진과 같은 시점의 값으로 같은 plan 에서 계산
+    # (원본 컬럼은 KR 필터 직후, 계산된 컬럼은 집계 직전)
+    categorical = [c for c in CATEGORICAL_COLUMNS if c in output_columns]
+    source_categorical = [c for c in categorical if c in filtered.columns]
+    computed_categorical = [c for c in categorical if c not in source_categorical]
+    prepared_df, positions, source_categories, computed_categories, counts = (
+        pl.collect_all(
+            [
+                prepared,
+                aggregated,
+                filtered.select(_unique_values(source_categorical)),
+                prepared.select(_unique_values(computed_categorical)),
+                source.lazy().select(pl.col("Cust Sys No").drop_nulls().n_unique()),
+            ]
+        )
+    )
+    collect_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    positions = positions.sort("Cust_Sys_No", nulls_last=True)
+    result = positions.with_columns(
+        [
+            prepared_df[col].gather(positions[col])
+            for col in output_columns
+            if col not in ("Cust_Sys_No", "Count_PO", "Quantity")
+        ]
+    )
+    processed_df = result.to_pandas()[output_columns]
+
+    # 키가 없는 행은 제외 (Count_PO 타입은 pandas 엔진과 같이 float)
+    missing_key = processed_df["Cust_Sys_No"].isna()
+    if missing_key.any():
+        processed_df = processed_df[~missing_key].reset_index(drop=True)
+        processed_df["Count_PO"] = processed_df["Count_PO"].astype("float64")
+
+    categories = {
+        **source_categories.row(0, named=True),
+        **computed_categories.row(0, named=True),
+    }
+    for col in categorical:
+        values = sorted(categories[col])
+        processed_df[col] = pd.Categorical(processed_df[col], categories=values)
+
+    processor = DataProcessor(config)
+    processed_df = enforce_schema(processor._handle_missing_values(processed_df))
+    finalize_seconds = time.perf_counter() - start
+
+    stats = processor._calculate_stats(processed_df, counts.item())
+    stats["stage_metrics"] = [
+        {
+            "stage": "polars_plan",
+            "seconds": collect_seconds,
+            "rows_in": len(df),
+            "rows_out": len(result),
+        },
+        {
+            "stage": "finalize",
+            "seconds": finalize_seconds,
+            "rows_in": len(result),
+            "rows_out": len(processed_df),
+        },
+    ]
+    _log_stats(stats)
+    return processed_df, stats
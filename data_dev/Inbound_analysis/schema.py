@@ -0,0 +1,252 @@
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Sequence, Tuple
+
+# Receiving_TAT_Report 테이블 스키마 (컬럼 -> pandas dtype -> MySQL 타입)
+# 처리 결과, DB 업로드, DB 추출(export) 경계에서 이 정의로 한 번씩만 타입을 맞춥니다.
+
+
+class ColumnSpec:
+    """
+    테이블 컬럼 하나의 정의입니다.
+    dtype: "str", "category", "int" (값 범위에 맞는 가장 작은 정수), "Int64" (결측 허용 정수),
+    "UInt64" (결측 허용 부호 없는 정수), "datetime", "date" (시간이 00:00 인 datetime64)
+    """
+
+    def __init__(
+        self, name: str, dtype: str, sql_type: str, primary_key: bool = False
+    ):
+        self.name = name
+        self.dtype = dtype
+        self.sql_type = sql_type
+        self.primary_key = primary_key
+
+    def __repr__(self) -> str:
+        return f"ColumnSpec({self.name}, {self.dtype}, {self.sql_type})"
+
+
+RECEIVING_TAT_SCHEMA: List[ColumnSpec] = [
+    ColumnSpec("Cust_Sys_No", "str", "VARCHAR(255)", primary_key=True),
+    ColumnSpec("ReceiptNo", "str", "VARCHAR(255)"),
+    ColumnSpec("Replen_Balance_Order", "Int64", "BIGINT"),
+    ColumnSpec("Allocated_Part", "str", "VARCHAR(255)"),
+    ColumnSpec("EDI_Order_Type", "category", "VARCHAR(255)"),
+    ColumnSpec("ShipFromCode", "category", "VARCHAR(255)"),
+    ColumnSpec("ShipToCode", "category", "VARCHAR(255)"),
+    ColumnSpec("Country", "category", "VARCHAR(255)"),
+    ColumnSpec("Quantity", "int", "BIGINT"),
+    ColumnSpec("PutAwayDate", "datetime", "DATETIME"),
+    ColumnSpec("InventoryDate", "date", "DATE"),
+    ColumnSpec("FY", "category", "VARCHAR(20)"),
+    ColumnSpec("Quarter", "category", "VARCHAR(10)"),
+    ColumnSpec("Month", "category", "VARCHAR(2)"),
+    ColumnSpec("Week", "category", "VARCHAR(10)"),
+    ColumnSpec("OrderType", "category", "VARCHAR(255)"),
+    ColumnSpec("Count_PO", "int", "INT"),
+    ColumnSpec("Row_Hash", "UInt64", "BIGINT UNSIGNED"),
+]
+
+RECEIVING_TAT_COLUMNS: List[str] = [spec.name for spec in RECEIVING_TAT_SCHEMA]
+
+# 업로드 시 행 내용 해시를 저장하는 컬럼 (처리 결과에는 없고 업로드 직전에 계산)
+ROW_HASH_COLUMN: str = "Row_Hash"
+
+# 처리 중 category dtype 으로 저장할 저카디널리티 컬럼 (rename 직후부터 적용)
+CATEGORICAL_COLUMNS: List[str] = [
+    spec.name for spec in RECEIVING_TAT_SCHEMA if spec.dtype == "category"
+]
+
+# 값 범위에 맞는 가장 작은 정수 타입으로 줄일 컬럼
+DOWNCAST_INTEGER_COLUMNS: List[str] = [
+    spec.name for spec in RECEIVING_TAT_SCHEMA if spec.dtype == "int"
+]
+
+
+def downcast_integer(series: pd.Series) -> pd.Series:
+    """
+    결측값이 없는 정수 컬럼을 값 범위에 맞는 가장 작은 정수 타입으로 바꿉니다.
+    (결측값이 있거나 정수가 아니면 그대로 반환)
+    """
+    if not pd.api.types.is_integer_dtype(series) or series.isna().any():
+        return series
+    values = pd.to_numeric(series.to_numpy(dtype=np.int64), downcast="integer")
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _enforce_column(series: pd.Series, spec: ColumnSpec) -> pd.Series:
+    if spec.dtype == "str":
+        if not pd.api.types.is_object_dtype(series):
+            series = series.astype(object).where(series.notna(), None)
+        return series
+
+    if spec.dtype == "category":
+        if not isinstance(series.dtype, pd.CategoricalDtype):
+            return series.astype("category")
+        # 처리 경로(전체/청크/국가별)와 관계없이 같은 dtype 이 되도록
+        # 필터링 등으로 남은 안 쓰는 카테고리를 버리고 정렬된 순서로 맞춤
+        # (astype("category") 와 같은 카테고리)
+        series = series.cat.remove_unused_categories()
+        categories = series.cat.categories
+        if not categories.is_monotonic_increasing:
+            series = series.cat.reorder_categories(categories.sort_values())
+        return series
+
+    if spec.dtype == "UInt64":
+        if not pd.api.types.is_unsigned_integer_dtype(series):
+            series = pd.to_numeric(series, errors="coerce")
+        return series.astype("UInt64")
+
+    if spec.dtype in ("int", "Int64"):
+        if not pd.api.types.is_integer_dtype(series):
+            series = pd.to_numeric(series, errors="coerce").astype("Int64")
+        if spec.dtype == "Int64":
+            return series.astype("Int64")
+        return downcast_integer(series)
+
+    # datetime / date
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.to_datetime(series, errors="coerce")
+    return series
+
+
+def enforce_schema(
+    df: pd.DataFrame, schema: Sequence[ColumnSpec] = RECEIVING_TAT_SCHEMA
+) -> pd.DataFrame:
+    """
+    스키마에 있는 컬럼을 정해진 pandas dtype 으로 맞춥니다.
+    (이미 맞는 컬럼은 건드리지 않으며, 스키마에 없는 컬럼과 컬럼 순서는 그대로 둠)
+    category 컬럼은 결과에 있는 값만 정렬된 순서로 카테고리로 남깁니다.
+    """
+    for spec in schema:
+        if spec.name in df.columns:
+            df[spec.name] = _enforce_column(df[spec.name], spec)
+    return df
+
+
+def create_table_sql(
+    table_name: str,
+    schema: Sequence[ColumnSpec] = RECEIVING_TAT_SCHEMA,
+    constraints: Sequence[str] = (),
+) -> str:
+    """
+    스키마로 CREATE TABLE IF NOT EXISTS 문을 만듭니다.
+    """
+    lines = [
+        f"{spec.name} {spec.sql_type}" + (" PRIMARY KEY" if spec.primary_key else "")
+        for spec in schema
+    ]
+    lines.extend(constraints)
+    body = ",\n        ".join(lines)
+    return f"""
+    CREATE TABLE IF NOT EXISTS {table_name} (
+        {body}
+    )
+    """
+
+
+def to_db_rows(
+    df: pd.DataFrame,
+    columns: Sequence[str],
+    schema: Sequence[ColumnSpec] = RECEIVING_TAT_SCHEMA,
+) -> List[Tuple]:
+    """
+    데이터프레임을 executemany 용 행 목록으로 바꿉니다.
+    문자열 포맷 없이 DATETIME 은 datetime, DATE 는 date, 정수는 int 로 넘기고 결측값은 None 입니다.
+    """
+    specs = {spec.name: spec for spec in schema}
+    arrays = []
+    for col in columns:
+        series = df[col]
+        missing = series.isna().to_numpy()
+        if pd.api.types.is_datetime64_any_dtype(series):
+            if col in specs and specs[col].dtype == "date":
+                values = series.dt.date.to_numpy()
+            else:
+                values = series.array.to_pydatetime()
+        else:
+            values = series.to_numpy(dtype=object)
+        values = np.asarray(values, dtype=object)
+        values[missing] = None
+        arrays.append(values)
+    return list(zip(*arrays))
+
+
+# LOAD DATA INFILE 기본 형식의 결측값 표기
+LOAD_DATA_NULL = "\\N"
+
+
+def _load_data_text(series: pd.Series, spec: Optional[ColumnSpec] = None) -> pd.Series:
+    """
+    컬럼 값을 LOAD DATA INFILE 기본 형식(역슬래시 이스케이프) 문자열로 바꿉니다.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        fmt = "%Y-%m-%d" if spec and spec.dtype == "date" else "%Y-%m-%d %H:%M:%S"
+        return series.dt.strftime(fmt)
+    if pd.api.types.is_float_dtype(series):
+        valid = series.dropna()
+        if (valid == np.floor(valid)).all():
+            series = series.astype("Int64")
+        return series.astype(str)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype(str)
+
+    text = series.astype(object).where(series.notna(), "").astype(str)
+    if text.str.contains(r"[\\\t\n\r]", regex=True).any():
+        for char, escaped in (
+            ("\\", "\\\\"),
+            ("\t", "\\t"),
+            ("\n", "\\n"),
+            ("\r", "\\r"),
+        ):
+            text = text.str.replace(char, escaped, regex=False)
+    return text
+
+
+def row_hashes(
+    df: pd.DataFrame,
+    columns: Sequence[str],
+    schema: Sequence[ColumnSpec] = RECEIVING_TAT_SCHEMA,
+) -> pd.Series:
+    """
+    업로드할 행 내용의 64비트 해시를 계산합니다. (같은 내용이면 실행마다 같은 값)
+    숫자는 float64, 날짜는 datetime64[ns], 나머지는 object 로 맞춘 뒤 계산하므로
+    정수 타입 크기나 category 카테고리가 달라도 값이 같으면 같은 해시입니다.
+    """
+    canonical = {}
+    for col in columns:
+        if col == ROW_HASH_COLUMN:
+            continue
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            canonical[col] = series.astype("datetime64[ns]")
+        elif pd.api.types.is_numeric_dtype(series):
+            canonical[col] = series.astype("float64")
+        else:
+            canonical[col] = series.astype(object).where(series.notna(), None)
+    return pd.util.hash_pandas_object(
+        pd.DataFrame(canonical, index=df.index), index=False
+    ).rename(ROW_HASH_COLUMN)
+
+
+def write_load_data_file(
+    df: pd.DataFrame,
+    columns: Sequence[str],
+    path: str,
+    schema: Sequence[ColumnSpec] = RECEIVING_TAT_SCHEMA,
+) -> int:
+    """
+    데이터프레임을 LOAD DATA LOCAL INFILE 용 파일(탭 구분, 줄바꿈 행 구분, 결측값 \\N,
+    UTF-8)로 저장하고 파일 크기(바이트)를 반환합니다.
+    """
+    specs = {spec.name: spec for spec in schema}
+    fields = []
+    for col in columns:
+        series = df[col]
+        text = _load_data_text(series, specs.get(col))
+        fields.append(text.where(series.notna().to_numpy(), LOAD_DATA_NULL))
+
+    lines = fields[0].str.cat(fields[1:], sep="\t") if len(fields) > 1 else fields[0]
+    data = ("\n".join(lines) + "\n").encode("utf-8") if len(lines) else b""
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
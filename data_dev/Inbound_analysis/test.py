@@ -3,11 +3,15 @@ import mysql.connector
 from mysql.connector import Error
 from config import DB_CONFIG, RECEIVING_TAT_REPORT_TABLE
 from datetime import datetime
+from excel_cache import read_excel_cached
+from excel_reader import read_source_sheet, SOURCE_VARIANT
 
 
 def read_excel(filepath, sheet_name):
     try:
-        df = pd.read_excel(filepath, sheet_name=sheet_name)
+        df = read_excel_cached(
+            filepath, sheet_name, loader=read_source_sheet, variant=SOURCE_VARIANT
+        )
         print(f"Successfully read {len(df)} rows from the Excel file.")
         return df
     except Exception as e:
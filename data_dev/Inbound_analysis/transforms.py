@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Tuple, Union
+
+Result = Union[pd.Series, pd.DataFrame]
+
+
+def factorize_values(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    컬럼을 행별 코드와 고유값 목록으로 나눕니다. (결측값도 하나의 고유값)
+    category 컬럼은 이미 가진 코드와 카테고리를 그대로 사용합니다.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype(np.intp)
+        uniques = series.cat.categories
+        missing = codes < 0
+        if missing.any():
+            codes[missing] = len(uniques)
+            uniques = uniques.insert(len(uniques), np.nan)
+        return codes, uniques
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return codes, pd.Index(uniques)
+
+
+def _scatter(
+    values: pd.Series, codes: np.ndarray, index: pd.Index, categorical: bool
+) -> pd.Series:
+    """
+    고유값별 결과를 행 코드 순서로 펼칩니다.
+    categorical 이면 결과 값을 정렬된 카테고리로 하는 category 컬럼을 만듭니다.
+    (astype("category") 와 같은 카테고리)
+    """
+    if categorical:
+        value_codes, categories = pd.factorize(values, sort=True)
+        return pd.Series(
+            pd.Categorical.from_codes(value_codes[codes], categories=categories),
+            index=index,
+        )
+    return pd.Series(values.array.take(codes), index=index)
+
+
+class TransformMemo:
+    """
+    값 단위 변환을 컬럼의 고유값에만 적용하고 행 코드로 결과를 되돌려 놓습니다.
+    변환 결과는 변환 이름별로 고유값을 키로 저장하므로,
+    같은 실행의 다른 단계나 다음 청크에서는 처음 나온 값만 새로 계산합니다.
+    """
+
+    def __init__(self):
+        self._results: Dict[str, Result] = {}
+
+    def _lookup(
+        self, name: str, uniques: pd.Index, func: Callable[[pd.Series], Result]
+    ) -> Result:
+        """
+        uniques 순서대로 변환 결과를 반환합니다. (저장된 결과가 없는 값만 func 로 계산)
+        """
+        memo = self._results.get(name)
+        positions = (
+            np.full(len(uniques), -1)
+            if memo is None
+            else memo.index.get_indexer(uniques)
+        )
+        new = positions < 0
+        if new.any():
+            new_values = uniques[new]
+            computed = func(pd.Series(new_values))
+            computed.index = new_values
+            memo = computed if memo is None else pd.concat([memo, computed])
+            self._results[name] = memo
+            positions = memo.index.get_indexer(uniques)
+        return memo.iloc[positions]
+
+    def apply(
+        self,
+        name: str,
+        series: pd.Series,
+        func: Callable[[pd.Series], Result],
+        categorical: bool = False,
+    ) -> Result:
+        """
+        series 의 고유값에 func 를 적용한 결과를 행 단위로 반환합니다.
+        func 는 고유값 Series 를 받아 같은 길이의 Series(또는 DataFrame)를 반환해야 하며,
+        같은 name 에는 항상 같은 변환을 사용해야 합니다.
+        """
+        codes, uniques = factorize_values(series)
+        results = self._lookup(name, uniques, func)
+        if isinstance(results, pd.DataFrame):
+            return pd.DataFrame(
+                {
+                    col: _scatter(results[col], codes, series.index, categorical)
+                    for col in results.columns
+                },
+                index=series.index,
+            )
+        return _scatter(results, codes, series.index, categorical).rename(series.name)
+
+    def clear(self):
+        self._results.clear()
@@ -0,0 +1,126 @@
+import pandas as pd
+from database import (
+    MySQLConnectionPool,
+    country_table_name,
+    create_country_tables,
+    create_tables,
+    read_query,
+    upload_to_mysql,
+)
+from config import LOAD_LEDGER_TABLE, LOAD_LEDGER_ROWS_TABLE, SCHEMA_VERSION_TABLE
+from schema import enforce_schema
+
+# 설정된 DB 의 검사용 테이블에 업로드하여 Quantity/Count_PO 누적 규칙을 확인하는 스크립트
+# (검사 후 테이블과 적재 원장, 스키마 버전 기록은 삭제)
+
+CHECK_COUNTRY = "CHECK"
+
+
+def sample_rows(quantity: int) -> pd.DataFrame:
+    return enforce_schema(
+        pd.DataFrame(
+            {
+                "Cust_Sys_No": ["CHECK-1", "CHECK-2"],
+                "ReceiptNo": ["R1", "R2"],
+                "EDI_Order_Type": ["REPLEN-IN", "REPLEN-IN"],
+                "Quantity": [quantity, 3],
+                "PutAwayDate": pd.to_datetime(["2024-07-01 10:00", "2024-07-02 11:00"]),
+                "Count_PO": [2, 1],
+            }
+        )
+    )
+
+
+def stored_totals(table_name: str) -> dict:
+    df = read_query(
+        f"SELECT Cust_Sys_No, Quantity, Count_PO FROM {table_name} ORDER BY Cust_Sys_No"
+    )
+    return {
+        row.Cust_Sys_No: (int(row.Quantity), int(row.Count_PO))
+        for row in df.itertuples()
+    }
+
+
+def check(label: str, actual: dict, expected: dict) -> bool:
+    ok = actual == expected
+    print(f"{'통과' if ok else '실패'}: {label} (결과 {actual}, 기대값 {expected})")
+    return ok
+
+
+def run_checks(table_name: str, method: str) -> list:
+    results = []
+
+    # 서로 다른 두 파일이 같은 키에 같은 수치를 가져오면 합계에 두 번 더해져야 함
+    upload_to_mysql(
+        sample_rows(5), table_name, source_hash="check-week-1", method=method
+    )
+    upload_to_mysql(
+        sample_rows(5), table_name, source_hash="check-week-2", method=method
+    )
+    results.append(
+        check(
+            f"[{method}] 다른 파일, 같은 수치",
+            stored_totals(table_name),
+            {"CHECK-1": (10, 4), "CHECK-2": (6, 2)},
+        )
+    )
+
+    # 같은 파일을 다시 올리면 바뀌지 않아야 함
+    upload_to_mysql(
+        sample_rows(5), table_name, source_hash="check-week-2", method=method
+    )
+    results.append(
+        check(
+            f"[{method}] 같은 파일 재업로드",
+            stored_totals(table_name),
+            {"CHECK-1": (10, 4), "CHECK-2": (6, 2)},
+        )
+    )
+
+    # 증분 적재(accumulate=False)는 더하지 않고 새 값으로 교체해야 함
+    upload_to_mysql(
+        sample_rows(7),
+        table_name,
+        source_hash="check-incremental",
+        method=method,
+        accumulate=False,
+    )
+    results.append(
+        check(
+            f"[{method}] 교체 업로드",
+            stored_totals(table_name),
+            {"CHECK-1": (7, 2), "CHECK-2": (3, 1)},
+        )
+    )
+    return results
+
+
+def cleanup(table_name: str):
+    with MySQLConnectionPool() as conn:
+        conn.execute_query(f"DROP TABLE IF EXISTS {table_name}")
+        for ledger_table in (LOAD_LEDGER_ROWS_TABLE, LOAD_LEDGER_TABLE):
+            conn.execute_query(
+                f"DELETE FROM {ledger_table} WHERE Table_Name = %s", (table_name,)
+            )
+        # 테이블을 지웠으므로 다음 검사에서 마이그레이션이 다시 만들도록 버전 기록도 삭제
+        conn.execute_query(
+            f"DELETE FROM {SCHEMA_VERSION_TABLE} WHERE Scope = %s", (table_name,)
+        )
+
+
+def main():
+    create_tables()
+    table_name = country_table_name(CHECK_COUNTRY)
+    results = []
+    for method in ("batch", "load_data"):
+        cleanup(table_name)
+        create_country_tables([CHECK_COUNTRY])
+        try:
+            results.extend(run_checks(table_name, method))
+        finally:
+            cleanup(table_name)
+    print(f"\n{sum(results)}/{len(results)}개 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+import time
 import logging
 from typing import Dict, Any, Optional
 import pandas as pd
@@ -17,6 +18,8 @@ from file_handler import (
 )
 from database import create_tables, upload_to_mysql
 from data_processor import main_data_processing
+from excel_cache import read_excel_cached, get_content_hash
+from excel_reader import read_source_sheet, SOURCE_VARIANT
 
 # 주간 불량 파일 데이터 변환 메인 스크립트
 
@@ -60,7 +63,9 @@ def read_excel(filepath: str, sheet_name: str) -> pd.DataFrame:
     """
     try:
         logger.info(f"엑셀 파일 '{filepath}' 읽기 시작")
-        df = pd.read_excel(filepath, sheet_name=sheet_name)
+        df = read_excel_cached(
+            filepath, sheet_name, loader=read_source_sheet, variant=SOURCE_VARIANT
+        )
         logger.info(f"엑셀 파일에서 {len(df)} 행의 데이터를 읽었습니다.")
         return df
     except Exception as e:
@@ -81,8 +86,16 @@ def process_and_upload_data(file_path: str, config: Dict[str, Any]):
         logger.info(processed_df.columns.tolist())
 
         logger.info("데이터베이스에 업로드 중...")
-        upload_to_mysql(processed_df)
-        logger.info("데이터가 성공적으로 데이터베이스에 업로드되었습니다.")
+        summary = upload_to_mysql(
+            processed_df,
+            source_hash=get_content_hash(file_path),
+            source_name=os.path.basename(file_path),
+        )
+        logger.info(
+            "데이터가 성공적으로 데이터베이스에 업로드되었습니다. "
+            f"(새 행 {summary['inserted']}, 변경 {summary['updated']}, "
+            f"건너뜀 {summary['skipped']})"
+        )
 
     except Exception as e:
         logger.error(f"파일 처리 중 오류 발생: {str(e)}", exc_info=True)
@@ -109,11 +122,14 @@ def main():
         new_name = f"{start_date[2:4]}{start_date[5:7]}{start_date[8:]}_{end_date[2:4]}{end_date[5:7]}{end_date[8:]}_ReceivingTAT_report.xlsx"
 
         logger.info("Report를 찾고 다운로드를 시작합니다.")
-        # RMA 반환 리포트 처리
+        # RMA 반환 리포트 처리 (요청 이후에 쓰인 파일만 이번 다운로드로 인정)
+        requested_at = time.time()
         crawler.process_rma_return(start_date, end_date)
 
         # 새로운 파일 다운로드 대기
-        new_files = wait_for_download(DOWNLOAD_FOLDER, existing_files)
+        new_files = wait_for_download(
+            DOWNLOAD_FOLDER, existing_files, requested_at=requested_at
+        )
 
         logger.info("다운로드된 파일의 이름을 변경합니다.")
         # 다운로드된 파일의 이름 변경
@@ -17,6 +17,9 @@ COMPLETE_FOLDER: str = "C:\\MyMain\\Teckwah\\download\\xlsx_files_complete"
 POOL_NAME: str = "mypool"
 POOL_SIZE: int = 5
 
+# 엑셀(xlsx/xlsb) 청크 단위 읽기 설정 (청크당 최대 행 수)
+EXCEL_CHUNK_SIZE: int = 5000
+
 # 타임아웃 설정
 DOWNLOAD_TIMEOUT: int = 120
 WEBDRIVER_TIMEOUT: int = 30
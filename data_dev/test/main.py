@@ -1,5 +1,4 @@
 import pandas as pd
-from pyxlsb import open_workbook
 from config import (
     DB_CONFIG,
     ORDER_TYPE_MAPPING,
@@ -10,6 +9,7 @@ from config import (
 from file_handler import process_file
 from database import create_tables, upload_to_mysql
 from data_processor import DataProcessor, main_data_processing
+from xlsb_reader import read_xlsb
 
 # Data Raw 파일 => db 변환 main 파일 아래 6개 파이썬 파일 import 연동 중
 # config.py: 설정 정보를 저장
@@ -20,19 +20,7 @@ from data_processor import DataProcessor, main_data_processing
 # main.py: 메인 실행 스크립트
 # login_crawling.py : 크롤링을 위한 처리 관련 기능
 # test.py : 원본데이터와 DB데이터 비교 테스트 기능
-
-
-def read_xlsb(filepath, sheet_name):
-    """
-    xlsb 파일을 읽어 데이터프레임으로 변환합니다.
-    """
-    with open_workbook(filepath) as wb:
-        with wb.get_sheet(sheet_name) as sheet:
-            data = [row for row in sheet.rows()]
-
-    headers = [cell.v for cell in data[0]]
-    data = [[cell.v for cell in row] for row in data[1:]]
-    return pd.DataFrame(data, columns=headers)
+# xlsb_reader.py : xlsb 파일을 컬럼 단위 배열로 읽는 기능
 
 
 def main():
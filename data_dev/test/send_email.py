@@ -14,20 +14,31 @@ db_config = {
     "password": "1234",
 }
 
-def get_database_data(query):
-    """데이터베이스에서 데이터를 조회합니다."""
+# 한 번에 가져오는 행 수
+FETCH_SIZE = 10000
+
+def get_database_data(query, fetch_size=FETCH_SIZE):
+    """데이터베이스에서 데이터를 조회합니다. (비버퍼 커서로 fetch_size 행씩 읽어 컬럼별로 모음)"""
     conn = mysql.connector.connect(**db_config)
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute(query)
-    data = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return data
+    cursor = conn.cursor(buffered=False)
+    try:
+        cursor.execute(query)
+        columns = [i[0] for i in cursor.description]
+        values = [[] for _ in columns]
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            for target, column in zip(values, zip(*rows)):
+                target.extend(column)
+    finally:
+        cursor.close()
+        conn.close()
+    return pd.DataFrame(dict(zip(columns, values)), columns=columns)
 
 def export_to_csv(data, file_path):
     """데이터를 CSV 파일로 내보냅니다."""
-    df = pd.DataFrame(data)
-    df.to_csv(file_path, index=False)
+    data.to_csv(file_path, index=False)
     print(f"데이터가 성공적으로 {file_path}에 내보내졌습니다.")
 
 def send_email_with_attachment(email_config, file_path):
@@ -2,14 +2,8 @@ import pandas as pd
 import mysql.connector
 from mysql.connector import Error
 from config import DB_CONFIG, RECEIVING_TAT_REPORT_TABLE
-import pyxlsb
 from datetime import datetime
-
-def read_xlsb(filepath, sheet_name):
-    with pyxlsb.open_workbook(filepath) as wb:
-        with wb.get_sheet(sheet_name) as sheet:
-            data = [[c.v for c in r] for r in sheet.rows()]
-    return pd.DataFrame(data[1:], columns=data[0])
+from xlsb_reader import read_xlsb
 
 def get_raw_data():
     raw_data_file = "C:/MyMain/test/Dashboard_Raw Data.xlsb"
@@ -0,0 +1,107 @@
+import logging
+from typing import Any, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from pyxlsb import open_workbook
+from config import EXCEL_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnBuffer:
+    """
+    한 컬럼의 값을 고정 크기 배열에 저장합니다.
+    숫자만 들어오는 동안은 float64 배열을 쓰고, 문자열 등이 들어오면 object 배열로 바꿉니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.numeric = True
+        self.size = 0
+
+    def append(self, value: Any) -> None:
+        if self.numeric:
+            if value is None:
+                value = np.nan
+            elif isinstance(value, bool) or not isinstance(value, (int, float)):
+                self._to_object()
+        self.values[self.size] = value
+        self.size += 1
+
+    def _to_object(self) -> None:
+        # 빈 셀은 원래 방식(리스트로 DataFrame 생성)과 같이 None 으로 되돌림
+        filled = self.values[: self.size]
+        values = np.empty(self.capacity, dtype=object)
+        values[: self.size] = filled
+        values[: self.size][np.isnan(filled)] = None
+        self.values = values
+        self.numeric = False
+
+    def take(self) -> np.ndarray:
+        """
+        저장된 값을 꺼내고 버퍼를 비웁니다.
+        """
+        values = self.values[: self.size].copy()
+        self.values = np.empty(self.capacity, dtype=np.float64)
+        self.numeric = True
+        self.size = 0
+        return values
+
+
+def iter_xlsb_chunks(
+    filepath: str, sheet_name: str, chunksize: Optional[int] = EXCEL_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """
+    xlsb 시트를 한 행씩 읽어 컬럼별 배열에 바로 저장하고,
+    chunksize 행마다 데이터프레임을 만들어 반환합니다. (None 이면 시트 전체를 한 번에)
+    """
+    with open_workbook(filepath) as wb:
+        with wb.get_sheet(sheet_name) as sheet:
+            rows = sheet.rows()
+            headers = [cell.v for cell in next(rows, [])]
+            width = len(headers)
+            if chunksize:
+                capacity = chunksize
+            elif sheet.dimension:
+                capacity = max(sheet.dimension.h - 1, 1)
+            else:
+                capacity = 65536
+            buffers: List[ColumnBuffer] = [ColumnBuffer(capacity) for _ in headers]
+
+            count = 0
+            chunk_count = 0
+            for row in rows:
+                for i in range(width):
+                    buffers[i].append(row[i].v if i < len(row) else None)
+                count += 1
+
+                if count == capacity:
+                    chunk_count += 1
+                    yield _build_frame(headers, buffers)
+                    count = 0
+
+            if count or chunk_count == 0:
+                chunk_count += 1
+                yield _build_frame(headers, buffers)
+
+    logger.info(f"'{sheet_name}' 시트를 {chunk_count}개 청크로 읽었습니다.")
+
+
+def _build_frame(headers: List[Any], buffers: List[ColumnBuffer]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {i: buffer.take() for i, buffer in enumerate(buffers)}
+    ).set_axis(headers, axis=1)
+
+
+def read_xlsb(
+    filepath: str, sheet_name: str, chunksize: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    xlsb 파일을 읽어 데이터프레임으로 변환합니다.
+    """
+    chunks = list(iter_xlsb_chunks(filepath, sheet_name, chunksize))
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)